@@ -3,6 +3,7 @@ Agent Controller - The Brain
 Orchestrates multi-step reasoning, decision making, and tool usage
 """
 
+import asyncio
 import os
 import re
 import logging
@@ -33,7 +34,8 @@ class AgentController:
         self,
         vector_store,
         session_memory,
-        llm_engine: Optional[Any] = None
+        llm_engine: Optional[Any] = None,
+        http_client: Optional[Any] = None
     ):
         self.vector_store = vector_store
         self.session_memory = session_memory
@@ -55,7 +57,7 @@ class AgentController:
         # Initialize tools
         self.rag_pipeline = RAGPipeline(vector_store)
         self.retrieval_api = RetrievalAPI(vector_store) if vector_store else None
-        self.web_search = WebSearchTool(vector_store=vector_store, llm_engine=self.llm_engine)
+        self.web_search = WebSearchTool(vector_store=vector_store, llm_engine=self.llm_engine, http_client=http_client)
         self.entity_extractor = EntityExtractor(None)  # Entity extractor doesn't need LLM
         self.conflict_detector = ConflictDetector()
         self.background_worker = get_worker()
@@ -222,7 +224,8 @@ class AgentController:
             conflicts = []
         else:
             self.progress_updates.append("🔎 **Step 3: Analyzing data for conflicts and contradictions...**")
-            conflicts = self._detect_conflicts(research_data)
+            # Regex-heavy and synchronous - keep it off the event loop
+            conflicts = await asyncio.to_thread(self._detect_conflicts, research_data)
         
         # If all sources are from uploaded documents, skip conflict resolution
         uploaded_only = all(d.get('source_type') == 'uploaded_document' for d in research_data)
@@ -265,10 +268,13 @@ class AgentController:
                     # Create a natural, conversational message with proper spacing
                     message = f"**I'm finding conflicting information about {topic_display}:**\n\n"
                     
-                    # Group by value and create friendly source descriptions
+                    # Group by canonical value and create friendly source descriptions
                     sources_by_value = {}
+                    canonical_by_raw = {}
                     for source in sources:
                         value = source.get('value', '')
+                        canonical = source.get('canonical', value)
+                        canonical_by_raw[value] = canonical
                         source_type = source.get('source', 'unknown')
                         source_file = source.get('source_file', '')
                         source_url = source.get('source_url', '')
@@ -289,15 +295,15 @@ class AgentController:
                         else:
                             source_label = "Research source"
                         
-                        if value not in sources_by_value:
-                            sources_by_value[value] = []
-                        sources_by_value[value].append(source_label)
+                        if canonical not in sources_by_value:
+                            sources_by_value[canonical] = []
+                        sources_by_value[canonical].append(source_label)
                     
                     # Format values nicely with proper spacing
                     for i, value in enumerate(values[:3]):  # Limit to 3 values
-                        source_list = sources_by_value.get(value, [])
-                        # Get unique sources
-                        unique_sources = list(set(source_list))
+                        source_list = sources_by_value.get(canonical_by_raw.get(value, value), [])
+                        # Get unique sources, in first-seen order
+                        unique_sources = list(dict.fromkeys(source_list))
                         
                         # Create friendly source description
                         if len(unique_sources) == 1:
@@ -620,7 +626,7 @@ Would you like me to explain any section in more detail, or shall we proceed wit
             
             for query_topic in search_queries[:3]:  # Use first 3 queries
                 logger.info(f"Searching web for: {company_name} {query_topic or ''}")
-                web_results = self.web_search.search_company(company_name, query_topic)
+                web_results = await self.web_search.asearch_company(company_name, query_topic)
                 logger.info(f"Web search returned {len(web_results)} results for query: {company_name} {query_topic or ''}")
                 for r in web_results:
                     url = r.get('url', '')
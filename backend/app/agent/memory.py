@@ -4,6 +4,7 @@ Maintains context across agent interactions
 """
 
 from typing import Dict, List, Optional, Any
+from collections import OrderedDict
 from datetime import datetime
 import uuid
 import logging
@@ -11,10 +12,14 @@ import logging
 logger = logging.getLogger(__name__)
 
 class SessionMemory:
-    """Manage session memory for the agent"""
+    """
+    Manage session memory for the agent
+    Bounded LRU - the least recently used sessions are evicted past max_entries
+    """
     
-    def __init__(self):
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def create_session(self, session_id: Optional[str] = None) -> str:
         """Create a new session"""
@@ -33,19 +38,34 @@ class SessionMemory:
             'agent_state': 'idle'
         }
         
+        self.sessions.move_to_end(session_id)
+        
+        # Evict least recently used sessions
+        while len(self.sessions) > self.max_entries:
+            evicted_id, _ = self.sessions.popitem(last=False)
+            logger.debug(f"Evicted session: {evicted_id}")
+        
         logger.info(f"Created session: {session_id}")
         return session_id
     
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session data"""
-        return self.sessions.get(session_id)
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+        return session
+    
+    def _session(self, session_id: str) -> Dict[str, Any]:
+        """Get session data, creating the session if needed"""
+        session = self.get_session(session_id)
+        if session is None:
+            self.create_session(session_id)
+            session = self.sessions[session_id]
+        return session
     
     def add_message(self, session_id: str, role: str, content: str):
         """Add a message to session"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['messages'].append({
+        self._session(session_id)['messages'].append({
             'role': role,
             'content': content,
             'timestamp': datetime.now().isoformat()
@@ -53,48 +73,30 @@ class SessionMemory:
     
     def set_company_name(self, session_id: str, company_name: str):
         """Set company name for session"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['company_name'] = company_name
+        self._session(session_id)['company_name'] = company_name
     
     def add_research_data(self, session_id: str, data: Dict[str, Any]):
         """Add research data to session"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['research_data'].append(data)
+        self._session(session_id)['research_data'].append(data)
     
     def set_account_plan(self, session_id: str, account_plan: Dict[str, Any]):
         """Set account plan for session"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['account_plan'] = account_plan
+        self._session(session_id)['account_plan'] = account_plan
     
     def add_conflict(self, session_id: str, conflict: Dict[str, Any]):
         """Add detected conflict"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['conflicts'].append(conflict)
+        self._session(session_id)['conflicts'].append(conflict)
     
     def add_question(self, session_id: str, question: str):
         """Add question asked to user"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['questions_asked'].append({
+        self._session(session_id)['questions_asked'].append({
             'question': question,
             'timestamp': datetime.now().isoformat()
         })
     
     def set_agent_state(self, session_id: str, state: str):
         """Set agent state"""
-        if session_id not in self.sessions:
-            self.create_session(session_id)
-        
-        self.sessions[session_id]['agent_state'] = state
+        self._session(session_id)['agent_state'] = state
     
     def get_conversation_history(self, session_id: str, limit: int = 10) -> List[Dict]:
         """Get recent conversation history"""
@@ -105,8 +105,8 @@ async def update_account_plan(
 ):
     """Update a specific section of the account plan"""
     try:
-        vector_store = request.state.vector_store
-        session_memory = request.state.session_memory
+        vector_store = request.app.state.vector_store
+        session_memory = request.app.state.session_memory
         
         session = session_memory.get_session(update.session_id)
         if not session:
@@ -116,7 +116,7 @@ async def update_account_plan(
             raise HTTPException(status_code=404, detail="Account plan not found")
         
         # Initialize agent controller
-        agent = AgentController(vector_store, session_memory)
+        agent = AgentController(vector_store, session_memory, http_client=request.app.state.http_client)
         
         # Update section
         account_plan = session['account_plan']
@@ -23,8 +23,8 @@ async def chat_endpoint(
     """Handle chat messages"""
     try:
         logger.info(f"Received chat message: {message.message[:50]}...")
-        vector_store = request.state.vector_store
-        session_memory = request.state.session_memory
+        vector_store = request.app.state.vector_store
+        session_memory = request.app.state.session_memory
         
         # Check if vector store is available
         if not vector_store:
@@ -39,7 +39,7 @@ async def chat_endpoint(
         # Initialize agent controller
         logger.info("Initializing agent controller...")
         logger.info("Creating Gemini LLM engine...")
-        agent = AgentController(vector_store, session_memory)
+        agent = AgentController(vector_store, session_memory, http_client=request.app.state.http_client)
         logger.info(f"Agent controller initialized with LLM provider: {agent.llm_provider}")
         
         # Store user_id in session for later use
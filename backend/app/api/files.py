@@ -26,7 +26,7 @@ async def upload_file(
 ):
     """Upload and process a document for a specific company"""
     try:
-        vector_store = request.state.vector_store if request else None
+        vector_store = request.app.state.vector_store if request else None
         if not vector_store:
             raise HTTPException(status_code=503, detail="Vector store not available")
         user_id = current_user["id"]
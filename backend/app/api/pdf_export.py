@@ -212,7 +212,7 @@ def create_pdf_from_account_plan(account_plan: Dict[str, Any], company_name: str
 async def download_account_plan_pdf(session_id: str, request: Request):
     """Download account plan as PDF"""
     try:
-        session_memory = request.state.session_memory
+        session_memory = request.app.state.session_memory
         session = session_memory.get_session(session_id)
         
         if not session or not session.get('account_plan'):
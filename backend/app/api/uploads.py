@@ -221,7 +221,7 @@ async def complete_upload(
         logger.info(f"Processing upload with company_name: {company_name}, chat_id: {chat_id}")
         
         # Process file with RAG pipeline immediately
-        vector_store = request.state.vector_store if request else None
+        vector_store = request.app.state.vector_store if request else None
         if not vector_store:
             logger.warning("Vector store not available - file saved but not processed")
         else:
@@ -58,7 +58,7 @@ async def transcribe_voice(voice_input: VoiceInput, request: Request):
         audio_data = base64.b64decode(audio_data_str)
         
         # Get session
-        session_memory = request.state.session_memory
+        session_memory = request.app.state.session_memory
         session_id = voice_input.session_id
         if not session_id:
             session_id = session_memory.create_session()
@@ -149,9 +149,10 @@ async def chat_stream(
                         main_module = sys.modules['main']
                         vector_store = getattr(main_module, 'vector_store', None)
                         session_memory = getattr(main_module, 'session_memory', None)
+                        http_client = getattr(main_module, 'http_client', None)
                     else:
                         # Direct import
-                        from main import vector_store, session_memory
+                        from main import vector_store, session_memory, http_client
                 except Exception as e:
                     logger.warning(f"Could not import vector_store from main: {e}")
                     # Fallback: create new instances
@@ -161,6 +162,7 @@ async def chat_stream(
                     except:
                         vector_store = None
                     session_memory = SessionMemory()
+                    http_client = None
                 
                 # Get orchestrator for request coordination
                 from app.orchestrator.research_orchestrator import get_orchestrator
@@ -169,7 +171,8 @@ async def chat_stream(
                 # Initialize AgentController with full pipeline
                 agent = AgentController(
                     vector_store=vector_store,
-                    session_memory=session_memory
+                    session_memory=session_memory,
+                    http_client=http_client
                 )
                 
                 # Use chat_id as session_id for agent
@@ -3,6 +3,7 @@ MongoDB database connection and configuration
 """
 
 import os
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
 import logging
@@ -38,11 +39,24 @@ async def connect_to_mongo():
         # Atlas connections may need longer timeout
         timeout = 10000 if is_atlas else 5000
         
+        # Explicit pool sizing - handlers fail fast instead of queueing behind a saturated pool
+        max_pool_size = int(os.getenv("MONGO_POOL_MAX", "50"))
+        min_pool_size = min(int(os.getenv("MONGO_POOL_MIN", "5")), max_pool_size)
+        wait_queue_timeout = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+        
         db.client = AsyncIOMotorClient(
             mongo_url,
+            maxPoolSize=max_pool_size,
+            minPoolSize=min_pool_size,
+            waitQueueTimeoutMS=wait_queue_timeout,
             serverSelectionTimeoutMS=timeout,
+            connectTimeoutMS=timeout,
             tlsAllowInvalidCertificates=False  # Set to True only for testing with self-signed certs
         )
+        logger.info(
+            f"MongoDB pool: maxPoolSize={max_pool_size}, minPoolSize={min_pool_size}, "
+            f"waitQueueTimeoutMS={wait_queue_timeout}, serverSelectionTimeoutMS={timeout}"
+        )
         
         # Test connection
         await db.client.admin.command('ping')
@@ -72,7 +86,8 @@ async def connect_to_mongo():
 async def close_mongo_connection():
     """Close database connection"""
     if db.client:
-        db.client.close()
+        # Blocking (joins pool/monitor threads) - run off the event loop so callers can time it out
+        await asyncio.to_thread(db.client.close)
         logger.info("MongoDB connection closed")
 
 def get_database():
@@ -2,7 +2,6 @@
 Middleware package
 """
 
-from app.middleware.rate_limit import rate_limit_middleware, get_rate_limiter
-
-__all__ = ['rate_limit_middleware', 'get_rate_limiter']
+from app.middleware.rate_limit import RateLimitMiddleware, get_rate_limiter, init_rate_limiter, close_rate_limiter
 
+__all__ = ['RateLimitMiddleware', 'get_rate_limiter', 'init_rate_limiter', 'close_rate_limiter']
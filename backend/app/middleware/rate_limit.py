@@ -4,18 +4,27 @@ Implements rate limiting for API endpoints
 """
 
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from collections import defaultdict
-from fastapi import Request, HTTPException, status
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Try to import redis asyncio client (optional) - counters shared across uvicorn workers
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 
 class RateLimiter:
     """
     Simple in-memory rate limiter
-    For production, consider using Redis-based rate limiting
+    Per-process fallback for when Redis is not reachable
     """
     
     def __init__(self):
@@ -79,8 +88,65 @@ class RateLimiter:
             logger.debug(f"Cleaned up {len(identifiers_to_remove)} rate limit entries")
 
 
-# Global rate limiter instance
+# Sliding window approximated from two fixed-window counters: the previous window's
+# count is weighted by how much of it still overlaps the sliding window. Runs atomically
+# in Redis (one round trip); rejected requests are not counted, as in the in-memory limiter
+_SLIDING_WINDOW_LUA = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * (1 - tonumber(ARGV[3])) + current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]) * 2)
+return 1
+"""
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed sliding window rate limiter (two-window weighted counter)
+    Counters live in Redis, so limits hold across uvicorn workers; one script call per request
+    """
+    
+    def __init__(self, client: "aioredis.Redis"):
+        self.client = client
+        self._sliding_window = client.register_script(_SLIDING_WINDOW_LUA)
+    
+    async def is_allowed(
+        self,
+        identifier: str,
+        max_requests: int = 100,
+        window_seconds: int = 60
+    ) -> bool:
+        """
+        Check if request is allowed
+        
+        Args:
+            identifier: Unique identifier (user_id, IP, etc.)
+            max_requests: Maximum requests allowed
+            window_seconds: Time window in seconds
+            
+        Returns:
+            True if allowed, False otherwise
+        """
+        window, elapsed = divmod(time.time(), window_seconds)
+        # Hash tag keeps both windows of one client in the same Redis Cluster slot
+        prefix = f"ratelimit:{{{identifier}:{window_seconds}}}"
+        allowed = await self._sliding_window(
+            keys=[f"{prefix}:{int(window)}", f"{prefix}:{int(window) - 1}"],
+            args=[max_requests, window_seconds, elapsed / window_seconds]
+        )
+        return bool(allowed)
+    
+    async def close(self):
+        """Close the Redis connection pool"""
+        await self.client.aclose()
+
+
+# Global rate limiter instances (Redis when connected, in-memory otherwise)
 _rate_limiter = RateLimiter()
+_redis_limiter: Optional[RedisRateLimiter] = None
 
 
 def get_rate_limiter() -> RateLimiter:
@@ -88,83 +154,127 @@ def get_rate_limiter() -> RateLimiter:
     return _rate_limiter
 
 
-async def rate_limit_middleware(request: Request, call_next):
+async def init_rate_limiter(redis_url: str) -> bool:
+    """
+    Connect the shared Redis rate limiter
+    
+    Args:
+        redis_url: Redis connection URL
+        
+    Returns:
+        True if Redis is used, False if falling back to the in-memory limiter
+    """
+    global _redis_limiter
+    
+    if not REDIS_AVAILABLE:
+        logger.warning("redis package not installed - using in-memory rate limiting (per worker)")
+        return False
+    
+    client = aioredis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=2)
+    try:
+        await client.ping()
+    except Exception as e:
+        logger.warning(f"Redis not reachable at {redis_url} ({e}) - using in-memory rate limiting (per worker)")
+        await client.aclose()
+        return False
+    
+    _redis_limiter = RedisRateLimiter(client)
+    logger.info("✅ Redis rate limiting enabled")
+    return True
+
+
+async def close_rate_limiter():
+    """Close the Redis rate limiter connection"""
+    global _redis_limiter
+    
+    if _redis_limiter is not None:
+        try:
+            await _redis_limiter.close()
+        except Exception:
+            pass
+        _redis_limiter = None
+
+
+def _limit_for_path(path: str) -> Tuple[int, int]:
     """
-    Rate limiting middleware
+    Rate limit for an endpoint
     
     Limits:
-    - Auth endpoints: 10 requests/minute
+    - Auth endpoints: 20 (login/register), 120 (profile), 30 (other) requests/minute
+    - Chats endpoints: 120 requests/minute
     - Chat endpoints: 30 requests/minute
     - Other endpoints: 100 requests/minute
+    
+    Returns:
+        (max_requests, window_seconds)
     """
-    try:
+    if "/api/auth" in path:
+        # Higher limit for auth endpoints - login/profile might be called frequently
+        # Separate limits for login vs profile
+        if "/api/auth/login" in path or "/api/auth/register" in path:
+            return 20, 60  # 20 login attempts per minute
+        if "/api/auth/profile" in path:
+            return 120, 60  # 120 profile requests per minute (2 per second) - increased for development
+        return 30, 60  # Other auth endpoints
+    if "/api/chats" in path:
+        # Higher limit for chats endpoint (used for polling chat list)
+        return 120, 60  # 2 requests per second
+    if "/api/chat" in path:
+        return 30, 60
+    return 100, 60
+
+
+async def _is_allowed(identifier: str, max_requests: int, window_seconds: int) -> bool:
+    """Check the shared Redis limiter, falling back to the in-memory one"""
+    if _redis_limiter is not None:
+        try:
+            return await _redis_limiter.is_allowed(identifier, max_requests, window_seconds)
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed, using in-memory limiter: {e}")
+    return _rate_limiter.is_allowed(identifier, max_requests, window_seconds)
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI rate limiting middleware
+    
+    Covers every HTTP request and WebSocket handshake - API routers, probes, the metrics
+    endpoint and static mounts alike - without BaseHTTPMiddleware's per-request task overhead
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        
         # Get identifier (user_id from token if available, otherwise IP)
-        identifier = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        identifier = client[0] if client else "unknown"
         
         # Get user_id from request state if available (set by auth middleware)
-        if hasattr(request.state, "user_id"):
-            identifier = f"user:{request.state.user_id}"
-        
-        # Determine rate limit based on endpoint
-        path = request.url.path
-        
-        if "/api/auth" in path:
-            # Higher limit for auth endpoints - login/profile might be called frequently
-            # Separate limits for login vs profile
-            if "/api/auth/login" in path or "/api/auth/register" in path:
-                max_requests = 20  # 20 login attempts per minute
-            elif "/api/auth/profile" in path:
-                max_requests = 120  # 120 profile requests per minute (2 per second) - increased for development
-            else:
-                max_requests = 30  # Other auth endpoints
-            window_seconds = 60
-        elif "/api/chats" in path:
-            # Higher limit for chats endpoint (used for polling chat list)
-            max_requests = 120  # 2 requests per second
-            window_seconds = 60
-        elif "/api/chat" in path:
-            max_requests = 30
-            window_seconds = 60
-        else:
-            max_requests = 100
-            window_seconds = 60
-        
-        # Check rate limit
-        if not _rate_limiter.is_allowed(identifier, max_requests, window_seconds):
-            logger.warning(f"Rate limit exceeded for {identifier} on {path} (limit: {max_requests}/{window_seconds}s)")
-            # Return 429 error - don't raise to avoid EndOfStream issues
-            from fastapi.responses import JSONResponse
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": f"Rate limit exceeded. Maximum {max_requests} requests per {window_seconds} seconds. Please wait a moment and try again."
-                }
-            )
+        state = scope.get("state") or {}
+        if "user_id" in state:
+            identifier = f"user:{state['user_id']}"
         
-        try:
-            response = await call_next(request)
-            return response
-        except Exception as e:
-            # Handle client disconnection gracefully
-            from anyio import EndOfStream
-            if isinstance(e, EndOfStream):
-                logger.debug(f"Client disconnected during request: {path}")
-                # Return empty response instead of raising
-                from fastapi.responses import Response
-                return Response(status_code=204)  # No Content
-            raise
-    except HTTPException:
-        # Re-raise HTTPException - let FastAPI handle it
-        # If client disconnected, EndOfStream will be caught by global handler
-        raise
-    except Exception as e:
-        # Handle client disconnection gracefully
-        from anyio import EndOfStream
-        if isinstance(e, EndOfStream):
-            # Client disconnected, don't try to send response
-            # Let it propagate to global handler
-            logger.debug(f"Client disconnected during rate limit check: {identifier if 'identifier' in locals() else 'unknown'}")
-            raise
-        # Re-raise other exceptions
-        raise
-
+        path = scope["path"]
+        max_requests, window_seconds = _limit_for_path(path)
+        
+        if await _is_allowed(identifier, max_requests, window_seconds):
+            await self.app(scope, receive, send)
+            return
+        
+        logger.warning(f"Rate limit exceeded for {identifier} on {path} (limit: {max_requests}/{window_seconds}s)")
+        if scope["type"] == "websocket":
+            # Reject the handshake (1008: policy violation)
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        response = ORJSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                "detail": f"Rate limit exceeded. Maximum {max_requests} requests per {window_seconds} seconds. Please wait a moment and try again."
+            }
+        )
+        await response(scope, receive, send)
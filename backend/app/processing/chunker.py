@@ -11,6 +11,9 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+# Paragraph boundary: a blank line (possibly containing whitespace)
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
 
 class DocumentChunker:
     """
@@ -60,6 +63,14 @@ class DocumentChunker:
             return []
         
         try:
+            # Fast path: text that fits in one chunk - the same single chunk paragraph
+            # chunking would produce, without the split/merge passes and size checks
+            if len(text) <= self.chunk_size:
+                chunk_text = "\n\n".join(para.strip() for para in _PARAGRAPH_SPLIT_RE.split(text) if para.strip())
+                if len(chunk_text) < self.min_chunk_size:
+                    return []
+                return [self._create_chunk(chunk_text, 0, metadata, url, query, 0)]
+            
             # Strategy 1: Try to chunk by paragraphs (best for semantic boundaries)
             chunks = self._chunk_by_paragraphs(text, metadata, url, query)
             
@@ -103,7 +114,7 @@ class DocumentChunker:
             List of chunks
         """
         # Split by double newlines (paragraphs)
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
         
         chunks = []
         current_chunk = ""
@@ -61,6 +61,62 @@ class DocumentScorer:
             "readability": self._score_readability(text)
         }
         
+        return self._combine_scores(scores, datetime.now().isoformat())
+    
+    def score_batch(
+        self,
+        texts: List[str],
+        metadatas: List[Dict],
+        query: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Score many chunks at once; same results as calling score() per chunk
+        
+        Query keywords are extracted once, and credibility is computed once per
+        distinct source (chunks of one page share its url).
+        
+        Args:
+            texts: Text content per chunk
+            metadatas: Metadata per chunk (same length as texts)
+            query: Optional query for relevance scoring
+            
+        Returns:
+            List of score dictionaries, one per chunk
+        """
+        query_words = self._query_keywords(query) if query else None
+        scored_at = datetime.now().isoformat()
+        credibility_by_source = {}
+        results = []
+        
+        for text, metadata in zip(texts, metadatas):
+            source_key = (metadata.get("url"), metadata.get("source_url"), metadata.get("domain"))
+            try:
+                credibility = credibility_by_source[source_key]
+            except KeyError:
+                credibility = credibility_by_source[source_key] = self._score_credibility(metadata)
+            
+            scores = {
+                "freshness": self._score_freshness(metadata),
+                "credibility": credibility,
+                "quality": self._score_quality(text, metadata),
+                "relevance": self._relevance_from_keywords(text, query_words) if query else 0.5,
+                "readability": self._score_readability(text)
+            }
+            results.append(self._combine_scores(scores, scored_at))
+        
+        return results
+    
+    def _combine_scores(self, scores: Dict[str, float], scored_at: str) -> Dict:
+        """
+        Combine component scores into the weighted total
+        
+        Args:
+            scores: Component scores
+            scored_at: ISO timestamp of scoring
+            
+        Returns:
+            Dictionary with scores and total score
+        """
         # Weighted total score
         weights = {
             "freshness": 0.15,
@@ -75,7 +131,7 @@ class DocumentScorer:
         return {
             "scores": scores,
             "total_score": round(total_score, 3),
-            "scored_at": datetime.now().isoformat()
+            "scored_at": scored_at
         }
     
     def _score_freshness(self, metadata: Dict) -> float:
@@ -219,16 +275,37 @@ class DocumentScorer:
         if not query:
             return 0.5
         
-        text_lower = text.lower()
-        query_lower = query.lower()
+        return self._relevance_from_keywords(text, self._query_keywords(query))
+    
+    def _query_keywords(self, query: str) -> set:
+        """
+        Extract relevance keywords from a query
         
-        # Extract keywords from query
-        query_words = set(re.findall(r'\b\w+\b', query_lower))
-        query_words = {w for w in query_words if len(w) > 3}  # Filter short words
+        Args:
+            query: Search query
+            
+        Returns:
+            Set of lowercase keywords longer than 3 characters
+        """
+        query_words = set(re.findall(r'\b\w+\b', query.lower()))
+        return {w for w in query_words if len(w) > 3}  # Filter short words
+    
+    def _relevance_from_keywords(self, text: str, query_words: set) -> float:
+        """
+        Score relevance of text against pre-extracted query keywords
         
+        Args:
+            text: Text content
+            query_words: Keywords from _query_keywords()
+            
+        Returns:
+            Relevance score (0.0-1.0)
+        """
         if not query_words:
             return 0.5
         
+        text_lower = text.lower()
+        
         # Count matches
         matches = sum(1 for word in query_words if word in text_lower)
         match_ratio = matches / len(query_words)
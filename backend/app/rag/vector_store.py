@@ -81,6 +81,8 @@ class VectorStore:
         
         # Initialize embedding model with offline/cached support
         model_name = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+        # Texts per embedding forward pass when adding documents
+        self.embedding_batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
         try:
             # Set cache directory to avoid repeated downloads
             cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "sentence_transformers")
@@ -99,8 +101,8 @@ class VectorStore:
             class DummyEmbedder:
                 def encode(self, texts, **kwargs):
                     import numpy as np
-                    # Return random embeddings as fallback
-                    return np.random.rand(len(texts), 384).tolist()
+                    # Return random embeddings as fallback (ndarray, like SentenceTransformer)
+                    return np.random.rand(len(texts), 384)
             self.embedder = DummyEmbedder()
             logger.warning("Using fallback embedder - upload documents may not work optimally")
     
@@ -114,8 +116,12 @@ class VectorStore:
         if not texts:
             return []
         
-        # Generate embeddings
-        embeddings = self.embedder.encode(texts, show_progress_bar=False).tolist()
+        # Generate embeddings for the whole batch in as few forward passes as possible
+        embeddings = self.embedder.encode(
+            texts,
+            batch_size=self.embedding_batch_size,
+            show_progress_bar=False
+        ).tolist()
         
         # Generate IDs if not provided
         if not ids:
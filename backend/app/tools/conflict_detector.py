@@ -3,12 +3,82 @@ Conflict detection module
 Detects contradictions in gathered information
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
+import os
+import re
+import sys
 from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Try to import RE2 (optional dependency) - linear-time DFA matching for the
+# value extraction patterns, which only use RE2-compatible syntax
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Topics whose values are compared numerically rather than as text
+NUMERIC_TOPICS = ('revenue', 'headcount', 'founded')
+
+# Percent difference above which numeric values count as a real conflict
+PERCENT_DIFF_THRESHOLDS = {'revenue': 10, 'headcount': 15}
+
+# Founding years within this many years of each other are treated as the same
+FOUNDED_YEAR_TOLERANCE = 2
+
+# Thousands separators and whitespace dropped from numeric values
+_STRIP_TABLE = str.maketrans('', '', ', \t\n\r')
+
+
+def _compile_value_pattern(pattern: str):
+    """Compile a case-insensitive extraction pattern, preferring RE2 when installed"""
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile('(?i)' + pattern)
+        except Exception as e:
+            logger.debug(f"RE2 rejected pattern, falling back to re: {e}")
+    # ASCII: \d and \s become single range checks; text is whitespace-normalized upstream
+    return re.compile(pattern, re.IGNORECASE | re.ASCII)
+
+# Value extraction patterns per topic, compiled once at import, tried in order.
+# Each pattern is paired with the literals it cannot match without (lowercase),
+# so patterns whose anchors are absent from the text are skipped without a scan
+_VALUE_PATTERNS = {
+    topic: [(anchors, _compile_value_pattern(pattern)) for anchors, pattern in patterns]
+    for topic, patterns in {
+        # Look for revenue numbers - be more specific
+        'revenue': [
+            (('revenue', 'sales', 'income'), r'(?:revenue|sales|income)[:\s]+(?:of|is|was|were|are)\s+[\$]?([\d,]+\.?\d*)\s*(?:million|billion|M|B|trillion)?'),
+            (('$',), r'[\$]([\d,]+\.?\d*)\s*(?:million|billion|M|B|trillion)?\s+(?:in\s+)?(?:annual\s+)?(?:revenue|sales)'),
+            (('revenue',), r'(?:annual\s+)?revenue\s+(?:of\s+)?[\$]?([\d,]+\.?\d*)\s*(?:million|billion|M|B|trillion)?')
+        ],
+        # Look for employee counts - be more specific
+        'headcount': [
+            (('employee',), r'(\d{1,3}(?:,\d{3})*)\s+employees?'),
+            (('employ',), r'employs?\s+(\d{1,3}(?:,\d{3})*)\s+(?:people|employees|staff)'),
+            (('workforce',), r'workforce\s+(?:of\s+)?(\d{1,3}(?:,\d{3})*)'),
+            (('approximately',), r'approximately\s+(\d{1,3}(?:,\d{3})*)\s+employees?')
+        ],
+        # Look for founding year
+        'founded': [
+            (('founded',), r'founded\s+in\s+(\d{4})'),
+            (('established',), r'established\s+in\s+(\d{4})'),
+            (('started',), r'started\s+in\s+(\d{4})'),
+            (('incorporated',), r'incorporated\s+in\s+(\d{4})'),
+            (('founded',), r'(\d{4})\s+(?:was\s+)?(?:the\s+)?year\s+(?:we\s+)?(?:were\s+)?founded')
+        ],
+        # Extract headquarters location
+        'location': [
+            (('headquarters',), r'headquarters[:\s]+(?:in|at|is\s+in|are\s+in|located\s+in)\s+([A-Z][a-zA-Z\s,]+(?:,\s*[A-Z][a-zA-Z]+)?)'),
+            (('based',), r'based\s+in\s+([A-Z][a-zA-Z\s,]+(?:,\s*[A-Z][a-zA-Z]+)?)'),
+            (('headquartered',), r'headquartered\s+in\s+([A-Z][a-zA-Z\s,]+(?:,\s*[A-Z][a-zA-Z]+)?)')
+        ],
+    }.items()
+}
+
 class ConflictDetector:
     """Detect conflicts and contradictions in research data"""
     
@@ -42,109 +112,100 @@ class ConflictDetector:
             logger.info("All sources from same document - skipping conflict detection")
             return []
         
-        # Group by topic, but track which document each value comes from
-        topic_data = defaultdict(list)
+        # Group by topic, but track which document each value comes from:
+        # entries keep source details, the dicts below are filled on insert
+        # so the conflict checks need no second pass over the entries
+        topic_entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        topic_values: Dict[str, Dict[str, Any]] = defaultdict(dict)  # doc_id -> canonical
+        topic_raw: Dict[str, Dict[Any, str]] = defaultdict(dict)  # canonical -> first raw value
         
         for doc_id, doc_sources in sources_by_document.items():
-            # For each document, extract the best value for each topic
-            doc_text = ' '.join([s.get('text', '') for s in doc_sources]).lower()
-            metadata = doc_sources[0].get('metadata', {})
-            source_type = doc_sources[0].get('source_type', 'unknown')
-            source_file = metadata.get('source_file', '')
-            source_url = source_file or metadata.get('url', '') or doc_id
-            
-            # Check each topic
-            for topic, keywords in self.conflict_keywords.items():
-                if any(keyword in doc_text for keyword in keywords):
-                    # Extract value for this topic from the combined document text
-                    value = self._extract_value(doc_text, topic)
-                    if value and value.strip():
-                        topic_data[topic].append({
-                            'value': value,
-                            'source': source_type,
-                            'document_id': doc_id,
-                            'source_file': source_file,
-                            'source_url': source_url,
-                            'metadata': metadata
-                        })
+            for topic, entry in self._extract_document_entries(doc_id, doc_sources):
+                canonical = entry['canonical']
+                topic_entries[topic].append(entry)
+                topic_values[topic][doc_id] = canonical
+                topic_raw[topic].setdefault(canonical, entry['value'])
         
         # Detect conflicts for each topic - only if values come from DIFFERENT documents
-        for topic, values in topic_data.items():
-            if len(values) < 2:
-                continue
-            
-            # Group by document to get unique values per document
-            values_by_doc = defaultdict(set)
-            for v in values:
-                values_by_doc[v['document_id']].add(v['value'])
+        for topic, values in topic_entries.items():
+            values_by_doc = topic_values[topic]
+            raw_by_canonical = topic_raw[topic]
             
-            # Only flag conflicts if we have different values from different documents
-            if len(values_by_doc) > 1:
-                # Get unique values across all documents
-                all_unique_values = set()
-                for doc_values in values_by_doc.values():
-                    all_unique_values.update(doc_values)
+            # Only flag conflicts if we have different values from different documents;
+            # values are canonical, so "1,000" and "1000" are not reported as a conflict
+            if len(values_by_doc) > 1 and len(raw_by_canonical) > 1:
+                all_unique_values = set(raw_by_canonical)
                 
-                # Only create conflict if there are genuinely different values
-                if len(all_unique_values) > 1:
-                    # For numeric topics, check if values are significantly different
-                    if topic in ['revenue', 'headcount', 'founded']:
-                        if not self._are_values_significantly_different(topic, all_unique_values):
-                            continue  # Skip - values are similar enough
-                    
-                    conflict = {
-                        'topic': topic,
-                        'conflicting_values': list(all_unique_values),
-                        'sources': values,
-                        'severity': self._calculate_severity(topic, all_unique_values)
-                    }
-                    conflicts.append(conflict)
-                    logger.info(f"Detected conflict for {topic}: {len(all_unique_values)} different values from {len(values_by_doc)} documents")
+                # For numeric topics, check if values are significantly different
+                if topic in NUMERIC_TOPICS:
+                    if not self._are_values_significantly_different(topic, all_unique_values):
+                        continue  # Skip - values are similar enough
+                
+                conflict = {
+                    'topic': topic,
+                    'conflicting_values': list(raw_by_canonical.values()),
+                    'sources': values,
+                    'severity': self._calculate_severity(topic, all_unique_values)
+                }
+                conflicts.append(conflict)
+                logger.info(f"Detected conflict for {topic}: {len(all_unique_values)} different values from {len(values_by_doc)} documents")
         
         return conflicts
     
+    def _extract_document_entries(self, doc_id: str, doc_sources: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Extract the best value for each topic from one document's combined text"""
+        doc_text = ' '.join([s.get('text', '') for s in doc_sources]).lower()
+        metadata = doc_sources[0].get('metadata', {})
+        # Interned: a handful of distinct values repeated across every entry
+        source_type = sys.intern(doc_sources[0].get('source_type', 'unknown'))
+        source_file = metadata.get('source_file', '')
+        source_url = source_file or metadata.get('url', '') or doc_id
+        
+        # Per-document fields shared by every topic entry
+        base_entry = {
+            'source': source_type,
+            'document_id': doc_id,
+            'source_file': source_file,
+            'source_url': source_url,
+            'metadata': metadata
+        }
+        
+        entries = []
+        # Check each topic mentioned in the document (substring tests run in C)
+        for topic, keywords in self.conflict_keywords.items():
+            if any(keyword in doc_text for keyword in keywords):
+                # Extract value for this topic from the combined document text
+                value = self._extract_value(doc_text, topic)
+                if value and value.strip():
+                    entry = base_entry.copy()
+                    entry['value'] = value
+                    entry['canonical'] = self._canonicalize(topic, value)
+                    entries.append((topic, entry))
+        return entries
+    
     def _extract_value(self, text: str, topic: str) -> Optional[str]:
-        """Extract value for a specific topic - improved accuracy"""
-        import re
+        """Extract value for a specific topic from lowercased text - improved accuracy"""
+        if topic not in _VALUE_PATTERNS:
+            # For other topics (products, market), don't extract - too ambiguous
+            # Only detect conflicts for factual, verifiable data
+            return None
         
-        if topic == 'revenue':
-            # Look for revenue numbers - be more specific
-            patterns = [
-                r'(?:revenue|sales|income)[:\s]+(?:of|is|was|were|are)\s+[\$]?([\d,]+\.?\d*)\s*(?:million|billion|M|B|trillion)?',
-                r'[\$]([\d,]+\.?\d*)\s*(?:million|billion|M|B|trillion)?\s+(?:in\s+)?(?:annual\s+)?(?:revenue|sales)',
-                r'(?:annual\s+)?revenue\s+(?:of\s+)?[\$]?([\d,]+\.?\d*)\s*(?:million|billion|M|B|trillion)?'
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    # Return the largest/most recent value (usually the most accurate)
-                    return matches[-1] if matches else None
+        # Prefilter: only run patterns whose anchor literal occurs in the text
+        patterns = [
+            pattern for anchors, pattern in _VALUE_PATTERNS[topic]
+            if any(anchor in text for anchor in anchors)
+        ]
         
-        elif topic == 'headcount':
-            # Look for employee counts - be more specific
-            patterns = [
-                r'(\d{1,3}(?:,\d{3})*)\s+employees?',
-                r'employs?\s+(\d{1,3}(?:,\d{3})*)\s+(?:people|employees|staff)',
-                r'workforce\s+(?:of\s+)?(\d{1,3}(?:,\d{3})*)',
-                r'approximately\s+(\d{1,3}(?:,\d{3})*)\s+employees?'
-            ]
+        if topic in ('revenue', 'headcount'):
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = pattern.findall(text)
                 if matches:
-                    # Return the most common or largest value
-                    return matches[-1] if matches else None
+                    # Return the most recent value (usually the most accurate)
+                    return matches[-1]
         
         elif topic == 'founded':
-            # Look for founding year
-            patterns = [
-                r'founded\s+in\s+(\d{4})',
-                r'established\s+in\s+(\d{4})',
-                r'started\s+in\s+(\d{4})',
-                r'incorporated\s+in\s+(\d{4})',
-                r'(\d{4})\s+(?:was\s+)?(?:the\s+)?year\s+(?:we\s+)?(?:were\s+)?founded'
-            ]
             for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+                matches = pattern.findall(text)
                 if matches:
                     # Return the earliest year (most likely founding year)
                     years = [int(m) for m in matches if 1800 <= int(m) <= 2100]
@@ -152,88 +213,44 @@ class ConflictDetector:
                         return str(min(years))
         
         elif topic == 'location':
-            # Extract headquarters location
-            patterns = [
-                r'headquarters[:\s]+(?:in|at|is\s+in|are\s+in|located\s+in)\s+([A-Z][a-zA-Z\s,]+(?:,\s*[A-Z][a-zA-Z]+)?)',
-                r'based\s+in\s+([A-Z][a-zA-Z\s,]+(?:,\s*[A-Z][a-zA-Z]+)?)',
-                r'headquartered\s+in\s+([A-Z][a-zA-Z\s,]+(?:,\s*[A-Z][a-zA-Z]+)?)'
-            ]
             for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+                match = pattern.search(text)
                 if match:
                     loc = match.group(1).strip()
                     # Clean up common false positives
                     if len(loc) > 3 and not any(word in loc.lower() for word in ['the', 'company', 'corporation']):
                         return loc[:50]  # Limit length
         
-        # For other topics (products, market), don't extract - too ambiguous
-        # Only detect conflicts for factual, verifiable data
         return None
     
+    def _canonicalize(self, topic: str, value: str) -> Union[int, float, str]:
+        """Normalize an extracted value once so formatting differences compare equal"""
+        if topic in NUMERIC_TOPICS:
+            num_str = value.translate(_STRIP_TABLE)
+            try:
+                if topic == 'revenue':
+                    return float(num_str)
+                return int(float(num_str))
+            except ValueError:
+                pass
+        return value.lower().strip()
+    
     def _are_values_significantly_different(self, topic: str, values: set) -> bool:
-        """Check if values are significantly different (not just formatting differences)"""
-        import re
+        """Check if canonical values are significantly different (not just formatting differences)"""
+        numbers = [v for v in values if isinstance(v, (int, float))]
+        if len(numbers) < 2:
+            return True  # Can't compare, assume different
         
-        if topic == 'revenue':
-            # Normalize values and compare
-            normalized = []
-            for v in values:
-                # Remove commas, convert to number
-                num_str = re.sub(r'[,\s]', '', str(v))
-                try:
-                    num = float(num_str)
-                    normalized.append(num)
-                except:
-                    continue
-            
-            if len(normalized) < 2:
-                return True  # Can't compare, assume different
-            
-            # Check if values differ by more than 10%
-            min_val = min(normalized)
-            max_val = max(normalized)
-            if min_val > 0:
-                diff_percent = ((max_val - min_val) / min_val) * 100
-                return diff_percent > 10  # More than 10% difference = significant
+        min_val = min(numbers)
+        max_val = max(numbers)
         
-        elif topic == 'headcount':
-            # Similar logic for headcount
-            normalized = []
-            for v in values:
-                num_str = re.sub(r'[,\s]', '', str(v))
-                try:
-                    num = int(num_str)
-                    normalized.append(num)
-                except:
-                    continue
-            
-            if len(normalized) < 2:
-                return True
-            
-            min_val = min(normalized)
-            max_val = max(normalized)
-            if min_val > 0:
-                diff_percent = ((max_val - min_val) / min_val) * 100
-                return diff_percent > 15  # More than 15% difference = significant
-        
-        elif topic == 'founded':
+        if topic == 'founded':
             # Years should be exact match or very close (within 1-2 years)
-            years = []
-            for v in values:
-                year_str = re.sub(r'[^\d]', '', str(v))
-                if year_str and len(year_str) == 4:
-                    try:
-                        year = int(year_str)
-                        if 1800 <= year <= 2100:
-                            years.append(year)
-                    except:
-                        continue
-            
-            if len(years) < 2:
-                return True
-            
-            # If years differ by more than 2, it's significant
-            return (max(years) - min(years)) > 2
+            return (max_val - min_val) > FOUNDED_YEAR_TOLERANCE
+        
+        threshold = PERCENT_DIFF_THRESHOLDS.get(topic)
+        if threshold is not None and min_val > 0:
+            return (max_val - min_val) / min_val * 100 > threshold
         
         return True  # Default: assume different
     
@@ -247,8 +264,6 @@ class ConflictDetector:
     
     def format_conflict_message(self, conflict: Dict[str, Any]) -> str:
         """Format conflict as a user-friendly message - NO URLs, clean formatting"""
-        import os
-        
         topic = conflict['topic']
         values = conflict['conflicting_values']
         sources = conflict['sources']
@@ -256,16 +271,22 @@ class ConflictDetector:
         # Format topic name nicely
         topic_display = topic.replace('_', ' ').title()
         
-        # Group sources by value
+        # Group sources by canonical value, so "1,000" and "1000" land together
+        # under the raw value the conflict reports for them
         sources_by_value = defaultdict(list)
+        canonical_by_raw = {}
         for source in sources:
-            value = source['value']
-            sources_by_value[value].append(source)
+            canonical = source['canonical']
+            sources_by_value[canonical].append(source)
+            canonical_by_raw[source['value']] = canonical
         
         message = f"**I'm finding conflicting information about {topic_display}:**\n\n"
         
+        # Friendly label per source file, so each file name is normalized once
+        friendly_cache = {}
+        
         for i, value in enumerate(values):
-            source_list = sources_by_value[value]
+            source_list = sources_by_value[canonical_by_raw[value]]
             
             # Create friendly source descriptions (NO URLs)
             friendly_sources = []
@@ -274,11 +295,14 @@ class ConflictDetector:
                 source_type = s.get('source', 'unknown')
                 
                 if source_file:
-                    # Extract just filename, no path or extension
-                    filename = os.path.basename(source_file)
-                    filename = os.path.splitext(filename)[0]
-                    filename = filename.replace('_', ' ').title()
-                    friendly_sources.append(f"Uploaded document ({filename})")
+                    label = friendly_cache.get(source_file)
+                    if label is None:
+                        # Extract just filename, no path or extension
+                        filename = os.path.basename(source_file)
+                        filename = os.path.splitext(filename)[0]
+                        filename = filename.replace('_', ' ').title()
+                        label = friendly_cache[source_file] = f"Uploaded document ({filename})"
+                    friendly_sources.append(label)
                 elif source_type == 'uploaded_document':
                     friendly_sources.append("Uploaded document")
                 elif source_type == 'web_search':
@@ -286,8 +310,8 @@ class ConflictDetector:
                 else:
                     friendly_sources.append("Research source")
             
-            # Get unique friendly sources
-            unique_sources = list(set(friendly_sources))
+            # Get unique friendly sources, in first-seen order
+            unique_sources = list(dict.fromkeys(friendly_sources))
             
             # Create source label
             if len(unique_sources) == 1:
@@ -4,11 +4,46 @@ Extracts structured information from text
 """
 
 import re
-from typing import Dict, List, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keywords that mark a sentence as mentioning each category
+CATEGORY_KEYWORDS = {
+    'products': ['product', 'offers', 'provides', 'sells'],
+    'services': ['service', 'solutions', 'consulting', 'support'],
+    'markets': ['market', 'industry', 'sector', 'vertical'],
+    'competitors': ['competitor', 'competes with', 'rival', 'vs.', 'versus'],
+}
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]')
+
+# Extraction results per distinct text, keyed by a digest so the (often
+# hundreds of KB) source texts are not pinned in memory by the cache
+_EXTRACT_CACHE_MAX_ENTRIES = 1024
+_extract_cache: "OrderedDict[bytes, Tuple]" = OrderedDict()
+_extract_cache_lock = threading.Lock()
+
+# Numeric patterns are ASCII-only: \d and \s become single range checks
+_REVENUE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.ASCII) for pattern in (
+        r'revenue\s+(?:of|is|was)\s+[\$]?([\d,]+\.?\d*)\s*(?:million|billion|M|B)?',
+        r'[\$]([\d,]+\.?\d*)\s*(?:million|billion|M|B)?\s+(?:in\s+)?revenue',
+    )
+]
+
+_HEADCOUNT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.ASCII) for pattern in (
+        r'(\d{1,3}(?:,\d{3})*)\s+employees?',
+        r'employs?\s+(\d{1,3}(?:,\d{3})*)',
+        r'workforce\s+of\s+(\d{1,3}(?:,\d{3})*)',
+    )
+]
+
 class EntityExtractor:
     """Extract entities from text using patterns and LLM"""
     
@@ -17,115 +52,111 @@ class EntityExtractor:
     
     def extract_entities(self, text: str) -> Dict:
         """Extract entities from text"""
+        (company_name, revenue, headcount, products,
+         services, markets, competitors, locations) = _extract_all(text)
+        # Cached results are tuples; hand callers fresh lists they can mutate
         entities = {
-            'company_name': self._extract_company_name(text),
-            'revenue': self._extract_revenue(text),
-            'headcount': self._extract_headcount(text),
-            'products': self._extract_products(text),
-            'services': self._extract_services(text),
-            'markets': self._extract_markets(text),
-            'competitors': self._extract_competitors(text),
-            'locations': self._extract_locations(text)
+            'company_name': company_name,
+            'revenue': list(revenue),
+            'headcount': list(headcount),
+            'products': list(products),
+            'services': list(services),
+            'markets': list(markets),
+            'competitors': list(competitors),
+            'locations': list(locations)
         }
         return entities
+
+
+def _extract_all(text: str) -> Tuple:
+    """Run every extractor once per distinct text (pure function of the text), LRU-cached by digest"""
+    key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _extract_cache_lock:
+        cached = _extract_cache.get(key)
+        if cached is not None:
+            _extract_cache.move_to_end(key)
+            return cached
     
-    def _extract_company_name(self, text: str) -> Optional[str]:
-        """Extract company name (simple pattern matching)"""
-        # Look for patterns like "Company Name Inc.", "Company Name Ltd."
-        patterns = [
-            r'([A-Z][a-zA-Z\s&]+)\s+(Inc\.|LLC|Ltd\.|Corp\.|Corporation|Company)',
-            r'([A-Z][a-zA-Z\s&]+)\s+is\s+(?:a|an)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
-    
-    def _extract_revenue(self, text: str) -> List[str]:
-        """Extract revenue mentions"""
-        patterns = [
-            r'revenue\s+(?:of|is|was)\s+[\$]?([\d,]+\.?\d*)\s*(?:million|billion|M|B)?',
-            r'[\$]([\d,]+\.?\d*)\s*(?:million|billion|M|B)?\s+(?:in\s+)?revenue',
-        ]
-        revenues = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            revenues.extend(matches)
-        return list(set(revenues))
-    
-    def _extract_headcount(self, text: str) -> List[str]:
-        """Extract employee count"""
-        patterns = [
-            r'(\d{1,3}(?:,\d{3})*)\s+employees?',
-            r'employs?\s+(\d{1,3}(?:,\d{3})*)',
-            r'workforce\s+of\s+(\d{1,3}(?:,\d{3})*)',
-        ]
-        headcounts = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            headcounts.extend(matches)
-        return list(set(headcounts))
-    
-    def _extract_products(self, text: str) -> List[str]:
-        """Extract product mentions"""
-        # Simple extraction - in production, use NER or LLM
-        products = []
-        product_keywords = ['product', 'offers', 'provides', 'sells']
-        sentences = re.split(r'[.!?]', text)
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in product_keywords):
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    keyword_sentences = _extract_keyword_sentences(sentences)
+    extracted = (
+        _extract_company_name(text),
+        tuple(_extract_revenue(text)),
+        tuple(_extract_headcount(text)),
+        tuple(keyword_sentences['products']),
+        tuple(keyword_sentences['services']),
+        tuple(keyword_sentences['markets']),
+        tuple(keyword_sentences['competitors']),
+        tuple(_extract_locations(text))
+    )
+    with _extract_cache_lock:
+        _extract_cache[key] = extracted
+        if len(_extract_cache) > _EXTRACT_CACHE_MAX_ENTRIES:
+            _extract_cache.popitem(last=False)
+    return extracted
+
+
+def _extract_company_name(text: str) -> Optional[str]:
+    """Extract company name (simple pattern matching)"""
+    # Look for patterns like "Company Name Inc.", "Company Name Ltd."
+    patterns = [
+        r'([A-Z][a-zA-Z\s&]+)\s+(Inc\.|LLC|Ltd\.|Corp\.|Corporation|Company)',
+        r'([A-Z][a-zA-Z\s&]+)\s+is\s+(?:a|an)',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def _extract_revenue(text: str) -> List[str]:
+    """Extract revenue mentions"""
+    revenues = []
+    for pattern in _REVENUE_PATTERNS:
+        matches = pattern.findall(text)
+        revenues.extend(matches)
+    return list(set(revenues))
+
+
+def _extract_headcount(text: str) -> List[str]:
+    """Extract employee count"""
+    headcounts = []
+    for pattern in _HEADCOUNT_PATTERNS:
+        matches = pattern.findall(text)
+        headcounts.extend(matches)
+    return list(set(headcounts))
+
+
+def _extract_keyword_sentences(sentences: List[str]) -> Dict[str, List[str]]:
+    """Extract product, service, market and competitor mentions in one pass over the sentences"""
+    # Simple extraction - in production, use NER or LLM
+    # sentences is _SENTENCE_SPLIT_RE.split(text), shared by the caller
+    results: Dict[str, List[str]] = {category: [] for category in CATEGORY_KEYWORDS}
+    for sentence in sentences:
+        # Lowercase once per sentence; the keyword tests are C-level substring searches
+        lowered = sentence.lower()
+        words = None
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            mentions = results[category]
+            if len(mentions) < 10 and any(keyword in lowered for keyword in keywords):
                 # Extract noun phrases (simplified)
-                words = sentence.split()
+                if words is None:
+                    words = sentence.split()
                 if len(words) > 2:
-                    products.append(' '.join(words[:5]))
-        return products[:10]  # Limit results
-    
-    def _extract_services(self, text: str) -> List[str]:
-        """Extract service mentions"""
-        services = []
-        service_keywords = ['service', 'solutions', 'consulting', 'support']
-        sentences = re.split(r'[.!?]', text)
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in service_keywords):
-                words = sentence.split()
-                if len(words) > 2:
-                    services.append(' '.join(words[:5]))
-        return services[:10]
-    
-    def _extract_markets(self, text: str) -> List[str]:
-        """Extract market/industry mentions"""
-        markets = []
-        market_keywords = ['market', 'industry', 'sector', 'vertical']
-        sentences = re.split(r'[.!?]', text)
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in market_keywords):
-                words = sentence.split()
-                if len(words) > 2:
-                    markets.append(' '.join(words[:5]))
-        return markets[:10]
-    
-    def _extract_competitors(self, text: str) -> List[str]:
-        """Extract competitor mentions"""
-        competitors = []
-        competitor_keywords = ['competitor', 'competes with', 'rival', 'vs.', 'versus']
-        sentences = re.split(r'[.!?]', text)
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in competitor_keywords):
-                words = sentence.split()
-                if len(words) > 2:
-                    competitors.append(' '.join(words[:5]))
-        return competitors[:10]
-    
-    def _extract_locations(self, text: str) -> List[str]:
-        """Extract location mentions"""
-        # Simple pattern for cities/countries
-        patterns = [
-            r'(?:in|at|from)\s+([A-Z][a-zA-Z\s]+(?:,\s*[A-Z][a-zA-Z]+)?)',
-        ]
-        locations = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            locations.extend(matches)
-        return list(set(locations))[:10]
+                    mentions.append(' '.join(words[:5]))
+    return results
+
+
+def _extract_locations(text: str) -> List[str]:
+    """Extract location mentions"""
+    # Simple pattern for cities/countries
+    patterns = [
+        r'(?:in|at|from)\s+([A-Z][a-zA-Z\s]+(?:,\s*[A-Z][a-zA-Z]+)?)',
+    ]
+    locations = []
+    for pattern in patterns:
+        matches = re.findall(pattern, text)
+        locations.extend(matches)
+    return list(set(locations))[:10]
 
@@ -4,13 +4,29 @@ Combines Serper.dev (Google Search), Firecrawl.dev (Deep Scraping), and LLM Inte
 """
 
 import os
+import re
 import json
 import time
+import sqlite3
+import heapq
+import hashlib
+import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+import contextlib
+import multiprocessing
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple, AsyncIterator
 from datetime import datetime
+from urllib.parse import unquote
+import numpy as np
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from requests.adapters import HTTPAdapter
+import httpx
 
 from app.llm.llm_factory import LLMFactory
 from app.processing.preprocessor import DocumentPreprocessor
@@ -19,6 +35,699 @@ from app.processing.scorer import DocumentScorer
 
 logger = logging.getLogger(__name__)
 
+# Try to import diskcache (optional dependency) for a persistent scrape cache
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Try to import orjson (optional dependency) - C JSON parser for API and LLM responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson (optional dependency) for streaming Firecrawl responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Try to import hyperscan (optional dependency) - single-pass multi-pattern prefilter for _clean_text()
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Markdown code fences around LLM JSON output (```json ... ``` preferred over bare ```)
+_JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|$)", re.DOTALL)
+_CODE_FENCE_RE = re.compile(r"```(.*?)(?:```|$)", re.DOTALL)
+
+# Artifact patterns stripped by WebSearchTool._clean_text(), compiled once
+_URL_ENCODED_RE = re.compile(r'%[0-9A-Fa-f]{2}')
+_HTTP_URL_RE = re.compile(r'https?://[^\s]+')
+_WWW_URL_RE = re.compile(r'www\.[^\s]+')
+_DOMAIN_RE = re.compile(r'[a-zA-Z0-9]+\.(io|com|org|net|edu|gov)[^\s]*')
+_TRACKING_PARAM_RE = re.compile(r'\b(rut|utm_|ref|source|campaign|medium|term|content)=[a-zA-Z0-9]+', re.IGNORECASE)
+_QUERY_PARAM_RE = re.compile(r'&[a-zA-Z0-9_]+=[a-zA-Z0-9]+')
+_HEX_ID_RE = re.compile(r'\b[0-9a-f]{32,}\b', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_ARTIFACT_PATTERNS = (
+    _URL_ENCODED_RE, _HTTP_URL_RE, _WWW_URL_RE, _DOMAIN_RE,
+    _TRACKING_PARAM_RE, _QUERY_PARAM_RE, _HEX_ID_RE
+)
+
+
+def _build_artifact_scanner() -> Optional[Any]:
+    """
+    Compile all _clean_text() artifact patterns into one Hyperscan database
+    
+    Returns:
+        Block-mode database, or None if hyperscan is unavailable or rejects a pattern
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[p.pattern.encode() for p in _ARTIFACT_PATTERNS],
+            ids=list(range(len(_ARTIFACT_PATTERNS))),
+            elements=len(_ARTIFACT_PATTERNS),
+            flags=[
+                hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+                | (hyperscan.HS_FLAG_CASELESS if p.flags & re.IGNORECASE else 0)
+                for p in _ARTIFACT_PATTERNS
+            ]
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"⚠️ Could not compile Hyperscan artifact database: {e}. Using re only.")
+        return None
+
+
+def _has_text_artifacts(text: str) -> bool:
+    """
+    Check in a single Hyperscan pass whether any artifact pattern occurs in text
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        False only if no pattern matches (True when unsure)
+    """
+    matched = []
+    try:
+        _ARTIFACT_SCANNER.scan(text.encode("utf-8"), match_event_handler=lambda *_: matched.append(True))
+    except Exception:
+        return True
+    return bool(matched)
+
+
+_ARTIFACT_SCANNER = _build_artifact_scanner()
+
+
+@lru_cache(maxsize=2048)
+def _clean_artifacts(text: str) -> str:
+    """Strip URL fragments, tracking parameters and hex IDs (see WebSearchTool._clean_text)"""
+    # Nothing to strip - one DFA pass instead of seven regex passes
+    if _ARTIFACT_SCANNER is not None and not _has_text_artifacts(text):
+        return _WHITESPACE_RE.sub(' ', unquote(text, errors='ignore')).strip()
+    
+    # Each pass is skipped when the literal it requires is absent (checked on the current text,
+    # since removals can join fragments like "ww%2Fw." into new matches)
+    
+    # Remove URL-encoded fragments
+    if '%' in text:
+        text = _URL_ENCODED_RE.sub('', text)
+    
+    # Remove URLs (applied in sequence - each pass sees the previous pass's output)
+    if '://' in text:
+        text = _HTTP_URL_RE.sub('', text)
+    if 'www.' in text:
+        text = _WWW_URL_RE.sub('', text)
+    if '.' in text:
+        text = _DOMAIN_RE.sub('', text)
+    
+    # Remove tracking parameters
+    if '=' in text:
+        text = _TRACKING_PARAM_RE.sub('', text)
+        text = _QUERY_PARAM_RE.sub('', text)
+    
+    # Remove hex tracking IDs
+    text = _HEX_ID_RE.sub('', text)
+    
+    # Decode URL-encoded characters
+    text = unquote(text, errors='ignore')
+    
+    # Clean up whitespace
+    text = _WHITESPACE_RE.sub(' ', text)
+    text = text.strip()
+    
+    return text
+
+
+def _sanitize_list(value: list) -> str:
+    """Convert a list to a JSON string for ChromaDB metadata"""
+    return _json_dumps(value) if value else ""
+
+
+def _sanitize_dict(value: dict) -> str:
+    """Convert a dict to a JSON string for ChromaDB metadata"""
+    return _json_dumps(value) if value else "{}"
+
+
+def _identity(value: Any) -> Any:
+    """Pass through values ChromaDB accepts as-is"""
+    return value
+
+
+# ChromaDB-compatible conversion per exact metadata value type (see _sanitize_metadata)
+_METADATA_SANITIZERS = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    list: _sanitize_list,
+    dict: _sanitize_dict,
+}
+
+
+def _sanitize_metadata(metadata: Dict) -> Dict:
+    """
+    Sanitize metadata for ChromaDB compatibility
+    ChromaDB only accepts: str, int, float, bool, None
+    Converts lists and dicts to JSON strings
+    
+    Args:
+        metadata: Metadata dictionary
+        
+    Returns:
+        Sanitized metadata dictionary
+    """
+    sanitized = {}
+    
+    for key, value in metadata.items():
+        # Exact-type table lookup; subclasses (numpy scalars, enums) take the isinstance chain
+        handler = _METADATA_SANITIZERS.get(type(value))
+        if handler is not None:
+            sanitized[key] = handler(value)
+        elif isinstance(value, (str, int, float, bool)):
+            sanitized[key] = value
+        elif isinstance(value, list):
+            sanitized[key] = _sanitize_list(value)
+        elif isinstance(value, dict):
+            sanitized[key] = _sanitize_dict(value)
+        else:
+            # Convert other types to string
+            sanitized[key] = str(value)
+    
+    return sanitized
+
+# Decodes the first JSON value in a string, leaving trailing text untouched
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _matching_brace_end(text: str, start: int) -> int:
+    """Index just past the '}' closing the object that opens at text[start], or -1 if unbalanced"""
+    depth = 0
+    in_str = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if escape:
+            escape = False
+        elif ch == '\\':
+            escape = True
+        elif ch == '"':
+            in_str = not in_str
+        elif not in_str:
+            if ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+    return -1
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from str/bytes with orjson when available, else the stdlib"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Stdlib is more lenient (NaN/Infinity, big ints) - and raises the same error type otherwise
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a JSON string with orjson when available, else the stdlib"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # Non-str keys, >64-bit ints, unknown types - the stdlib handles or reports these
+            pass
+    return json.dumps(value)
+
+
+def _encode_json_body(kwargs: Dict[str, Any], body_key: str) -> Dict[str, Any]:
+    """
+    Pre-serialize a json= request body with orjson (callers send Content-Type themselves)
+    
+    Args:
+        kwargs: Request keyword arguments
+        body_key: Raw body argument of the HTTP client ("data" for requests, "content" for httpx)
+        
+    Returns:
+        Request keyword arguments with the body encoded once
+    """
+    if ORJSON_AVAILABLE and "json" in kwargs:
+        kwargs[body_key] = orjson.dumps(kwargs.pop("json"))
+    return kwargs
+
+
+# Sort key for processed results (every merged/basic result carries a confidence)
+_CONFIDENCE_KEY = itemgetter("confidence")
+
+def _make_analysis(item: Dict) -> Dict:
+    """
+    Validate one LLM analysis item against the fixed analysis schema
+    
+    Args:
+        item: Parsed JSON object for one search result
+        
+    Returns:
+        Analysis dict with sanitized confidence, summary, is_duplicate and key_facts
+    """
+    confidence = item.get("confidence", 0.8)
+    if not isinstance(confidence, (int, float)) or confidence < 0 or confidence > 1:
+        logger.warning(f"Invalid confidence value, using default: {confidence}")
+        confidence = 0.8
+    key_facts = item.get("key_facts")
+    
+    return {
+        "confidence": float(confidence),
+        "summary": str(item.get("summary", "")).strip(),
+        "is_duplicate": bool(item.get("is_duplicate", False)),
+        "key_facts": key_facts if isinstance(key_facts, list) else []
+    }
+
+
+# Transient HTTP statuses worth retrying (rate limiting / upstream overload)
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+# Prompt for LLM post-processing of one batch of search results
+LLM_BATCH_PROMPT_TEMPLATE = """Analyze these {count} search results for the query: "{query}"
+
+{results_text}
+
+For each result, provide:
+- A relevance confidence score (0.0 to 1.0)
+- A brief 2-3 sentence summary
+- 2-3 key facts
+
+Return ONLY a valid JSON array in this exact format:
+[
+  {{"index": 0, "confidence": 0.95, "summary": "Brief summary here", "key_facts": ["fact1", "fact2"]}},
+  {{"index": 1, "confidence": 0.90, "summary": "Brief summary here", "key_facts": ["fact1", "fact2"]}}
+]
+
+Important: Return ONLY the JSON array, no markdown code blocks, no explanations, no text before or after."""
+
+
+# Per-process preprocessor for pool workers
+_worker_preprocessor: Optional[DocumentPreprocessor] = None
+
+
+def _preprocess_markdown(raw_content: str, url: str, preprocessor: Optional[DocumentPreprocessor] = None) -> str:
+    """
+    Run scraped markdown through the preprocessing pipeline
+    Module-level so it can be pickled into a ProcessPoolExecutor worker
+    
+    Args:
+        raw_content: Raw markdown from Firecrawl
+        url: URL that was scraped
+        preprocessor: Preprocessor to use (defaults to a per-process instance)
+        
+    Returns:
+        Clean text (up to 10k chars), or the raw content if preprocessing fails
+    """
+    global _worker_preprocessor
+    if preprocessor is None:
+        if _worker_preprocessor is None:
+            _worker_preprocessor = DocumentPreprocessor()
+        preprocessor = _worker_preprocessor
+    
+    # Use preprocessing pipeline for clean extraction
+    try:
+        processed = preprocessor.preprocess(
+            content=raw_content,
+            content_type="markdown",
+            url=url
+        )
+        
+        cleaned_text = processed.get("text", "") if isinstance(processed, dict) else str(processed)
+        if cleaned_text and len(cleaned_text.strip()) > 50:
+            return cleaned_text[:10000]  # Limit to 10k chars
+        else:
+            logger.debug(f"Preprocessed content too short for {url}: {len(cleaned_text)} chars")
+            # Fallback: use raw content if preprocessing fails
+            return raw_content[:10000]
+    except Exception as preprocess_error:
+        logger.warning(f"Preprocessing failed for {url}, using raw content: {preprocess_error}")
+        # Fallback: use raw content if preprocessing fails
+        return raw_content[:10000]
+
+
+def _chunk_and_score(
+    text: str,
+    metadata: Dict,
+    url: str,
+    query: str,
+    chunker: DocumentChunker,
+    scorer: DocumentScorer
+) -> Tuple[List[str], List[Dict]]:
+    """
+    Chunk one search result and keep its high-quality chunks, ready for the vector store
+    Module-level so it can be pickled into a ProcessPoolExecutor worker
+    
+    Args:
+        text: Title and content of the result
+        metadata: Metadata attached to every chunk
+        url: Result URL
+        query: Original search query
+        chunker: Chunker to split the text
+        scorer: Scorer for chunk quality
+        
+    Returns:
+        (texts, ChromaDB-safe metadatas) of chunks scoring at least 0.3, highest score first
+    """
+    chunks = chunker.chunk(text=text, metadata=metadata, url=url, query=query)
+    score_results = scorer.score_batch(
+        [chunk['text'] for chunk in chunks],
+        [chunk['metadata'] for chunk in chunks],
+        query
+    )
+    
+    # Parallel arrays: threshold and rank on a float vector, then gather the kept chunks.
+    # A stable argsort on the negated scores keeps ties in chunk order, like sort(reverse=True)
+    scores = np.fromiter((score_result['total_score'] for score_result in score_results), dtype=np.float64, count=len(score_results))
+    kept = np.flatnonzero(scores >= 0.3)
+    order = kept[np.argsort(-scores[kept], kind='stable')]
+    
+    # One pass: attach the score and sanitize for ChromaDB (lists/dicts to JSON strings)
+    texts = []
+    metadatas = []
+    for i in order.tolist():
+        chunk = chunks[i]
+        chunk['metadata']['score'] = score_results[i]
+        texts.append(chunk['text'])
+        metadatas.append(_sanitize_metadata(chunk['metadata']))
+    return texts, metadatas
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for an upstream API
+    Opens after consecutive failures and fails fast until the cooldown expires,
+    then lets calls through (half-open) until one succeeds or fails
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 60.0):
+        """
+        Initialize circuit breaker
+        
+        Args:
+            name: Upstream name (for logging)
+            failure_threshold: Consecutive failures before the circuit opens
+            cooldown: Seconds to fail fast before probing the upstream again
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self.state = "closed"
+        self._lock = threading.Lock()
+    
+    def is_open(self) -> bool:
+        """Check whether calls should fail fast (moves to half-open once the cooldown expires)"""
+        with self._lock:
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half_open"
+                logger.info(f"🔌 {self.name} circuit half-open - probing upstream")
+            return self.state == "open"
+    
+    def record_success(self) -> None:
+        """Reset the failure count and close the circuit"""
+        with self._lock:
+            if self.state != "closed":
+                logger.info(f"✅ {self.name} circuit closed - upstream recovered")
+            self.failure_count = 0
+            self.opened_at = None
+            self.state = "closed"
+    
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit at the threshold (or on a failed probe)"""
+        with self._lock:
+            self.failure_count += 1
+            if self.state == "half_open" or self.failure_count >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(f"⚠️ {self.name} circuit open after {self.failure_count} failures - failing fast for {self.cooldown:.0f}s")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limit (semaphore-like) that halves when the upstream
+    rate limits (429) and recovers one slot after a run of successful calls
+    """
+    
+    def __init__(self, max_limit: int, recovery_successes: int = 5):
+        """
+        Initialize limiter
+        
+        Args:
+            max_limit: Concurrency ceiling (e.g. the Firecrawl plan limit)
+            recovery_successes: Consecutive successes needed to restore one slot
+        """
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self.recovery_successes = recovery_successes
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+    
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+    
+    def record_success(self) -> None:
+        """Count a successful call and restore a slot after enough of them"""
+        self._successes += 1
+        if self.limit < self.max_limit and self._successes >= self.recovery_successes:
+            self.limit += 1
+            self._successes = 0
+            logger.info(f"🔼 Firecrawl concurrency restored to {self.limit}")
+    
+    def record_rate_limited(self) -> None:
+        """Halve the limit after a 429 response"""
+        self._successes = 0
+        reduced = max(1, self.limit // 2)
+        if reduced < self.limit:
+            self.limit = reduced
+            logger.warning(f"🔽 Firecrawl rate limited - concurrency reduced to {self.limit}")
+
+
+class SQLiteScrapeCache:
+    """
+    Minimal persistent key/value cache on stdlib sqlite3 (diskcache-compatible get/set)
+    Used for scraped pages when diskcache is not installed
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            path: SQLite database file path
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")  # Concurrent readers across worker processes
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, content TEXT, scraped_at REAL, expires_at REAL)"
+            )
+    
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Get (content, scraped_at) for a key, or None if missing/expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, scraped_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+    
+    def set(self, key: str, value: Tuple[str, float], expire: float) -> None:
+        """Store (content, scraped_at) for a key with a TTL in seconds"""
+        content, scraped_at = value
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, content, scraped_at, expires_at) VALUES (?, ?, ?, ?)",
+                (key, content, scraped_at, time.time() + expire)
+            )
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide breakers shared by all WebSearchTool instances
+_breaker_threshold = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5"))
+_breaker_cooldown = float(os.getenv("CIRCUIT_BREAKER_COOLDOWN", "60"))
+_serper_breaker = CircuitBreaker("Serper", _breaker_threshold, _breaker_cooldown)
+_firecrawl_breaker = CircuitBreaker("Firecrawl", _breaker_threshold, _breaker_cooldown)
+
+# Firecrawl's concurrency limit is account-wide, so one limiter per event loop is shared by
+# every WebSearchTool (and keeps what it learned from 429s across requests)
+_firecrawl_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AdaptiveConcurrencyLimiter]" = weakref.WeakKeyDictionary()
+_firecrawl_limiters_lock = threading.Lock()
+
+
+def _get_firecrawl_limiter(max_limit: int) -> AdaptiveConcurrencyLimiter:
+    """
+    Get the shared Firecrawl limiter for the running event loop, creating it on first use
+    
+    Args:
+        max_limit: Concurrency ceiling used when the limiter is created
+        
+    Returns:
+        The loop's AdaptiveConcurrencyLimiter
+    """
+    loop = asyncio.get_running_loop()
+    with _firecrawl_limiters_lock:
+        limiter = _firecrawl_limiters.get(loop)
+        if limiter is None:
+            limiter = _firecrawl_limiters[loop] = AdaptiveConcurrencyLimiter(max_limit)
+        return limiter
+
+
+# Process-wide semantic result cache - WebSearchTool is built per request, so the cache
+# must outlive the instance to ever serve a later query
+_semantic_cache: List[Dict] = []
+_semantic_cache_lock = threading.Lock()
+
+
+def _semantic_cache_key(company_name: Optional[str], query: str) -> str:
+    """
+    Partition key for the semantic cache - the company when known, else the normalized query
+    
+    Template queries for different companies share almost every token, so embedding
+    similarity alone would serve one company's results for another; it is only
+    compared between entries under the same key
+    """
+    return " ".join((company_name or query).lower().split())
+
+
+def _build_http_session() -> requests.Session:
+    """Pooled sync transport - keep-alive connections to Serper/Firecrawl across calls and threads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+# One session per process - a per-request session would never reuse its pool
+_http_session = _build_http_session()
+
+# Scrape cache, opened once per process on first use (see _get_scrape_cache())
+_scrape_cache: Any = None
+_scrape_cache_on_disk = False
+_scrape_cache_lock = threading.Lock()
+
+
+def _get_scrape_cache() -> Tuple[Any, bool]:
+    """
+    Get the process-wide Firecrawl scrape cache, opening it on first use
+    
+    Returns:
+        (cache, on_disk) - a diskcache/SQLite cache, or an in-memory OrderedDict fallback
+    """
+    global _scrape_cache, _scrape_cache_on_disk
+    
+    with _scrape_cache_lock:
+        if _scrape_cache is None:
+            # Persistent (SQLite-backed) so entries survive restarts and are shared across workers
+            cache_dir = os.getenv("FIRECRAWL_CACHE_DIR", ".firecrawl_cache")
+            try:
+                if DISKCACHE_AVAILABLE:
+                    _scrape_cache = diskcache.Cache(cache_dir, size_limit=1 << 30)
+                else:
+                    _scrape_cache = SQLiteScrapeCache(os.path.join(cache_dir, "scrapes.sqlite3"))
+                _scrape_cache_on_disk = True
+            except Exception as e:
+                logger.warning(f"⚠️ Could not open Firecrawl disk cache: {e}. Using in-memory cache.")
+                _scrape_cache = OrderedDict()
+                _scrape_cache_on_disk = False
+        return _scrape_cache, _scrape_cache_on_disk
+
+
+def _close_scrape_cache() -> None:
+    """Close the on-disk scrape cache (its file handles) if it was opened"""
+    global _scrape_cache, _scrape_cache_on_disk
+    
+    with _scrape_cache_lock:
+        if _scrape_cache_on_disk:
+            _scrape_cache.close()
+        _scrape_cache = None
+        _scrape_cache_on_disk = False
+
+
+# CPU pool for preprocessing and RAG chunking, started once per process on first use
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_cpu_pool_lock = threading.Lock()
+
+
+def _get_cpu_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Get the process-wide CPU pool, starting it on first use
+    
+    Args:
+        workers: Pool size (0 disables the pool)
+        
+    Returns:
+        The shared ProcessPoolExecutor, or None if disabled
+    """
+    global _cpu_pool
+    
+    if workers <= 0:
+        return None
+    with _cpu_pool_lock:
+        if _cpu_pool is None:
+            # Spawned (not forked) workers - the server process runs Mongo/HTTP threads whose
+            # locks a forked child could inherit mid-acquire
+            _cpu_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            logger.info(f"✅ Preprocessing pool started with {workers} workers")
+        return _cpu_pool
+
+
+def _shutdown_cpu_pool() -> None:
+    """Stop the CPU pool's worker processes if it was started"""
+    global _cpu_pool
+    
+    with _cpu_pool_lock:
+        if _cpu_pool is not None:
+            _cpu_pool.shutdown(wait=True, cancel_futures=True)
+            _cpu_pool = None
+
+
+def close_shared_resources() -> None:
+    """Release the process-wide resources shared by all WebSearchTool instances (app shutdown)"""
+    _http_session.close()
+    _close_scrape_cache()
+    _shutdown_cpu_pool()
+
 
 class WebSearchTool:
     """
@@ -29,28 +738,93 @@ class WebSearchTool:
     4. RAG integration for vector storage
     """
     
-    def __init__(self, vector_store=None, llm_engine=None):
+    def __init__(self, vector_store=None, llm_engine=None, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize WebSearchTool with API keys and dependencies
         
         Args:
             vector_store: Optional VectorStore instance for RAG integration
             llm_engine: Optional LLM engine instance (defaults to Gemini)
+            http_client: Optional app-wide async HTTP client (owned by the caller, never closed here)
         """
         # API Configuration
         self.serper_api_key = os.getenv("SERPER_API_KEY", "")
         self.firecrawl_api_key = os.getenv("FIRECRAWL_API_KEY", "")
         self.enabled = os.getenv("ENABLE_WEB_SEARCH", "true").lower() == "true"
         
+        # Request headers (built once - reused by every call)
+        self._serper_headers = {
+            "X-API-KEY": self.serper_api_key,
+            "Content-Type": "application/json"
+        }
+        self._firecrawl_headers = {
+            "Authorization": f"Bearer {self.firecrawl_api_key}",
+            "Content-Type": "application/json"
+        }
+        
         # API Endpoints
         self.serper_url = "https://google.serper.dev/search"
         self.firecrawl_url = "https://api.firecrawl.dev/v1/scrape"
+        self.firecrawl_batch_url = "https://api.firecrawl.dev/v1/batch/scrape"
         
         # Configuration
         self.max_results = 10
         self.top_urls_to_scrape = 5  # Number of top URLs to scrape with Firecrawl
+        # Concurrent Firecrawl scrapes - keep within the plan's limit (Free=2, Standard=5)
+        self.firecrawl_concurrency = max(1, int(os.getenv("FIRECRAWL_CONCURRENCY", "2")))
+        # Scrape the top URLs with one batch job instead of one request per URL
+        # Opt-in: a job that outlives the poll deadline keeps running (and billing) upstream
+        self.firecrawl_batch_scrape = os.getenv("FIRECRAWL_BATCH_SCRAPE", "false").lower() == "true"
+        self.batch_poll_interval = 1.0  # Seconds between batch job status checks
         self.request_timeout = 30  # Timeout for API requests
         self.max_retries = 3  # Maximum retry attempts
+        self.firecrawl_attempts = 2  # Scrapes are per-URL and have a snippet fallback - retry less
+        self.max_retry_after = 30.0  # Cap on a server-provided Retry-After wait (seconds)
+        self.llm_batch_size = 3  # Results per LLM post-processing call (small to avoid MAX_TOKENS truncation)
+        self.llm_min_batch_chars = 500  # Batches with less scraped content skip LLM post-processing
+        self.llm_concurrency = max(1, int(os.getenv("LLM_CONCURRENCY", "4")))  # In-flight LLM batch calls (async path)
+        self.rag_write_batch_size = 64  # Chunks per vector_store.add_documents() call
+        self.rag_write_workers = 4  # Concurrent add_documents() calls (embedding overlaps writes)
+        
+        # Scrape cache - repeat URLs skip the Firecrawl call (and its credit)
+        self.scrape_cache_enabled = os.getenv("ENABLE_FIRECRAWL_CACHE", "true").lower() == "true"
+        self.scrape_cache_ttl = int(os.getenv("FIRECRAWL_CACHE_TTL", "86400"))  # 24 hours
+        self.scrape_cache_max_entries = 512  # In-memory fallback only
+        # Process-wide cache (opened once, closed by close_shared_resources())
+        self._scrape_cache = None
+        self._scrape_cache_on_disk = False
+        self._scrape_cache_lock = _scrape_cache_lock
+        if self.scrape_cache_enabled:
+            self._scrape_cache, self._scrape_cache_on_disk = _get_scrape_cache()
+        
+        # CPU workers for preprocessing and RAG chunking (0 = inline). The pool is process-wide
+        # and shut down with the app (close_shared_resources()), so hot reloads don't leak it
+        # Opt-in: each server worker would start its own pool (and each pool process re-imports the app)
+        self.preprocess_workers = int(os.getenv("PREPROCESS_WORKERS", "0"))
+        
+        # Preprocessed text keyed by SHA-256 of the raw page content (LRU)
+        self.preproc_cache_max_entries = 2048
+        self._preproc_cache = OrderedDict()
+        self._preproc_cache_lock = threading.Lock()
+        
+        # Pooled sync transport (process-wide, closed by close_shared_resources())
+        self._session = _http_session
+        
+        # Async transport (created lazily, bound to the running event loop)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        # A shared client is only usable on the event loop it was created on (the server loop)
+        self._shared_http = http_client
+        try:
+            self._shared_http_loop = asyncio.get_running_loop() if http_client is not None else None
+        except RuntimeError:
+            self._shared_http_loop = None
+        
+        # Semantic result cache - near-duplicate queries reuse recent results
+        self.semantic_cache_enabled = os.getenv("ENABLE_SEMANTIC_CACHE", "true").lower() == "true"
+        self.semantic_cache_threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))  # Cosine similarity
+        self.semantic_cache_ttl = int(os.getenv("SEMANTIC_CACHE_TTL", "21600"))  # 6 hours
+        self.semantic_cache_max_entries = 256
         
         # Dependencies
         self.vector_store = vector_store
@@ -90,13 +864,14 @@ class WebSearchTool:
         else:
             logger.warning("⚠️ Web search is DISABLED. Set ENABLE_WEB_SEARCH=true in .env to enable.")
     
-    def search(self, query: str, max_results: int = 5) -> List[Dict]:
+    def search(self, query: str, max_results: int = 5, company_name: Optional[str] = None) -> List[Dict]:
         """
         Main search method - orchestrates the hybrid search pipeline
         
         Args:
             query: Search query string
             max_results: Maximum number of results to return
+            company_name: Company the query is about (scopes semantic cache hits)
             
         Returns:
             List of search result dictionaries with enhanced data
@@ -108,6 +883,13 @@ class WebSearchTool:
         try:
             logger.info(f"🔍 Starting hybrid search for: {query}")
             
+            # Serve semantically equivalent recent queries from cache
+            cache_key = _semantic_cache_key(company_name, query)
+            query_embedding = self._embed_query(query)
+            cached_results = self._lookup_semantic_cache(cache_key, query_embedding, max_results)
+            if cached_results is not None:
+                return cached_results
+            
             # Step 1: Search Layer - Get SERP results from Serper
             serp_results = self._search_with_serper(query, max_results)
             
@@ -118,18 +900,9 @@ class WebSearchTool:
             # Step 2: Crawling Layer - Scrape top URLs with Firecrawl
             enriched_results = self._enrich_with_firecrawl(serp_results, query)
             
-            # Step 3: Intelligence Layer - LLM post-processing
-            processed_results = self._process_with_llm(enriched_results, query)
-            
-            # Ensure we have results - if LLM processing failed, use enriched results
-            if not processed_results or len(processed_results) == 0:
-                logger.warning("LLM processing returned no results, using enriched results")
-                processed_results = enriched_results
-            
-            # Step 4: RAG Integration - Store in vector database
-            self._store_in_rag(processed_results, query)
-            
-            logger.info(f"✅ Search completed: {len(processed_results)} results for '{query}'")
+            # Steps 3-4: LLM post-processing and RAG storage
+            processed_results = self._finalize_results(enriched_results, query)
+            self._store_semantic_cache(cache_key, query_embedding, query, max_results, processed_results)
             return processed_results
             
         except Exception as e:
@@ -143,6 +916,230 @@ class WebSearchTool:
                 pass
             return []
     
+    async def asearch(self, query: str, max_results: int = 5, company_name: Optional[str] = None) -> List[Dict]:
+        """
+        Async variant of search() - Serper and Firecrawl calls are awaited on the
+        event loop (scrapes run concurrently); LLM and RAG steps run in a worker thread
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            company_name: Company the query is about (scopes semantic cache hits)
+            
+        Returns:
+            List of search result dictionaries with enhanced data
+        """
+        if not self.enabled:
+            logger.warning("Web search is disabled")
+            return []
+        
+        enriched_results = None
+        try:
+            logger.info(f"🔍 Starting async hybrid search for: {query}")
+            
+            # Serve semantically equivalent recent queries from cache (embedding is CPU work)
+            cache_key = _semantic_cache_key(company_name, query)
+            query_embedding = await asyncio.to_thread(self._embed_query, query)
+            cached_results = self._lookup_semantic_cache(cache_key, query_embedding, max_results)
+            if cached_results is not None:
+                return cached_results
+            
+            # Step 1: Search Layer - Get SERP results from Serper
+            serp_results = await self._async_search_with_serper(query, max_results)
+            
+            if not serp_results:
+                logger.warning(f"No SERP results found for query: {query}")
+                return []
+            
+            # Step 2: Crawling Layer - Scrape top URLs with Firecrawl concurrently
+            enriched_results = await self._aenrich_with_firecrawl(serp_results, query)
+            
+            # Steps 3-4: LLM post-processing (concurrent batches) and RAG storage
+            processed_results = await self._afinalize_results(enriched_results, query)
+            self._store_semantic_cache(cache_key, query_embedding, query, max_results, processed_results)
+            return processed_results
+            
+        except Exception as e:
+            logger.error(f"❌ Web search error for query '{query}': {e}", exc_info=True)
+            if enriched_results:
+                logger.info(f"Returning {len(enriched_results)} enriched results despite error")
+                return enriched_results
+            return []
+    
+    def _embed_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Embed a query with the vector store's embedder for semantic cache lookups
+        
+        Args:
+            query: Search query string
+            
+        Returns:
+            Unit-normalized embedding, or None if the cache is unavailable
+        """
+        if not self.semantic_cache_enabled or not self.vector_store:
+            return None
+        
+        try:
+            embedding = np.asarray(
+                self.vector_store.embedder.encode([query], show_progress_bar=False)[0],
+                dtype=np.float32
+            )
+            norm = float(np.linalg.norm(embedding))
+            if not norm:
+                return None
+            return embedding / norm
+        except Exception as e:
+            logger.debug(f"Could not embed query for semantic cache: {e}")
+            return None
+    
+    def _lookup_semantic_cache(self, key: str, embedding: Optional[np.ndarray], max_results: int) -> Optional[List[Dict]]:
+        """
+        Find cached results for a semantically similar recent query under the same key
+        
+        Args:
+            key: Cache partition from _semantic_cache_key()
+            embedding: Unit-normalized query embedding
+            max_results: Requested result count (must match the cached search)
+            
+        Returns:
+            Copy of the cached results, or None on a miss
+        """
+        if embedding is None:
+            return None
+        
+        now = time.monotonic()
+        with _semantic_cache_lock:
+            # Drop expired entries
+            _semantic_cache[:] = [e for e in _semantic_cache if e["expires_at"] > now]
+            candidates = [
+                e for e in _semantic_cache
+                if e["key"] == key and e["max_results"] == max_results
+            ]
+        if not candidates:
+            return None
+        
+        # Embeddings are normalized, so one matrix-vector product gives every cosine similarity
+        scores = np.stack([e["embedding"] for e in candidates]) @ embedding
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+        if best_score < self.semantic_cache_threshold:
+            return None
+        best_entry = candidates[best]
+        logger.info(f"♻️ Semantic cache hit (similarity {best_score:.3f}) - reusing results for '{best_entry['query']}'")
+        return [dict(result) for result in best_entry["results"]]
+    
+    def _store_semantic_cache(self, key: str, embedding: Optional[np.ndarray], query: str, max_results: int, results: List[Dict]):
+        """Cache processed results under the key and query embedding with a TTL"""
+        if embedding is None or not results:
+            return
+        
+        entry = {
+            "key": key,
+            "embedding": embedding,
+            "query": query,
+            "max_results": max_results,
+            "results": [dict(result) for result in results],
+            "expires_at": time.monotonic() + self.semantic_cache_ttl
+        }
+        with _semantic_cache_lock:
+            _semantic_cache.append(entry)
+            # Evict oldest entries beyond the size limit
+            if len(_semantic_cache) > self.semantic_cache_max_entries:
+                del _semantic_cache[:-self.semantic_cache_max_entries]
+    
+    def _finalize_results(self, enriched_results: List[Dict], query: str) -> List[Dict]:
+        """Run LLM post-processing and RAG storage on enriched results"""
+        # Step 3: Intelligence Layer - LLM post-processing
+        processed_results = self._process_with_llm(enriched_results, query)
+        return self._store_processed_results(enriched_results, processed_results, query)
+    
+    async def _afinalize_results(self, enriched_results: List[Dict], query: str) -> List[Dict]:
+        """
+        Async variant of _finalize_results() - LLM batches are queued for RAG ingestion as
+        soon as they are processed, so chunking and storage overlap the later LLM calls
+        """
+        processed_batches = {}
+        stored_urls = set()
+        rag_queue: asyncio.Queue = asyncio.Queue()
+        consumer = asyncio.create_task(self._aconsume_rag_queue(rag_queue, query))
+        
+        try:
+            async for batch_index, batch_processed in self._aprocess_with_llm_stream(enriched_results, query):
+                processed_batches[batch_index] = batch_processed
+                
+                # Step 4: RAG Integration - skip URLs an earlier batch already stored
+                new_results = [r for r in batch_processed if not r.get("url") or r["url"] not in stored_urls]
+                stored_urls.update(r["url"] for r in new_results if r.get("url"))
+                if new_results:
+                    rag_queue.put_nowait(new_results)
+        finally:
+            # None tells the consumer the stream is done - it flushes and exits
+            rag_queue.put_nowait(None)
+            await consumer
+        
+        # Global ranking needs every batch - merge in batch order so ties keep SERP order
+        processed_results = self._rank_processed_results(
+            enriched_results,
+            [result for i in sorted(processed_batches) for result in processed_batches[i]]
+        )
+        
+        logger.info(f"✅ Search completed: {len(processed_results)} results for '{query}'")
+        return processed_results
+    
+    async def _aconsume_rag_queue(self, queue: "asyncio.Queue[Optional[List[Dict]]]", query: str) -> None:
+        """
+        Chunk and score queued result batches (in a worker thread) and write them to the
+        vector store in rag_write_batch_size batches - or sooner, whenever the queue drains
+        
+        Args:
+            queue: Processed result batches, terminated by None
+            query: Original search query
+        """
+        pending_texts: List[str] = []
+        pending_metadatas: List[Dict] = []
+        seen_texts = set()
+        stored = 0
+        finished = False
+        
+        while not finished:
+            results = await queue.get()
+            if results is None:
+                finished = True
+            elif self.vector_store:
+                try:
+                    texts, metadatas = await asyncio.to_thread(self._chunk_results_for_rag, results, query, seen_texts)
+                    pending_texts.extend(texts)
+                    pending_metadatas.extend(metadatas)
+                except Exception as e:
+                    logger.warning(f"Failed to chunk results for RAG: {e}", exc_info=True)
+            
+            # Full batches always go out; a partial one only when nothing else is waiting
+            size = self.rag_write_batch_size
+            while len(pending_texts) >= size or (pending_texts and (finished or queue.empty())):
+                texts, pending_texts = pending_texts[:size], pending_texts[size:]
+                metadatas, pending_metadatas = pending_metadatas[:size], pending_metadatas[size:]
+                try:
+                    await asyncio.to_thread(self.vector_store.add_documents, texts=texts, metadatas=metadatas)
+                    stored += len(texts)
+                except Exception as e:
+                    logger.warning(f"Failed to store results in RAG: {e}", exc_info=True)
+        
+        if stored:
+            logger.info(f"✅ Stored {stored} processed chunks in vector database")
+    
+    def _store_processed_results(self, enriched_results: List[Dict], processed_results: List[Dict], query: str) -> List[Dict]:
+        """Fall back to enriched results if LLM processing produced nothing, then store in RAG"""
+        # Ensure we have results - if LLM processing failed, use enriched results
+        if not processed_results or len(processed_results) == 0:
+            logger.warning("LLM processing returned no results, using enriched results")
+            processed_results = enriched_results
+        
+        # Step 4: RAG Integration - Store in vector database
+        self._store_in_rag(processed_results, query)
+        
+        logger.info(f"✅ Search completed: {len(processed_results)} results for '{query}'")
+        return processed_results
+    
     def search_company(self, company_name: str, topic: str = None) -> List[Dict]:
         """
         Search for specific company information
@@ -154,15 +1151,31 @@ class WebSearchTool:
         Returns:
             List of search results related to the company
         """
+        results = self.search(
+            self._company_query(company_name, topic),
+            max_results=self.max_results,
+            company_name=company_name
+        )
+        return self._clean_company_results(results)
+    
+    async def asearch_company(self, company_name: str, topic: str = None) -> List[Dict]:
+        """Async variant of search_company()"""
+        results = await self.asearch(
+            self._company_query(company_name, topic),
+            max_results=self.max_results,
+            company_name=company_name
+        )
+        return self._clean_company_results(results)
+    
+    def _company_query(self, company_name: str, topic: Optional[str]) -> str:
+        """Build the search query for a company and optional topic"""
         if topic:
-            query = f"{company_name} {topic}"
-        else:
-            # Enhanced query for better results
-            query = f"{company_name} company overview business products services"
-        
-        results = self.search(query, max_results=self.max_results)
-        
-        # Post-process to ensure clean text
+            return f"{company_name} {topic}"
+        # Enhanced query for better results
+        return f"{company_name} company overview business products services"
+    
+    def _clean_company_results(self, results: List[Dict]) -> List[Dict]:
+        """Post-process company search results to ensure clean text"""
         cleaned_results = []
         for result in results:
             cleaned_result = {
@@ -202,11 +1215,6 @@ class WebSearchTool:
     
     # ==================== Search Layer (Serper) ====================
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((requests.exceptions.RequestException, TimeoutError))
-    )
     def _search_with_serper(self, query: str, max_results: int) -> List[Dict]:
         """
         Search using Serper.dev Google Search API
@@ -222,52 +1230,91 @@ class WebSearchTool:
             logger.warning("SERPER_API_KEY not available. Using fallback search.")
             return self._fallback_search(query, max_results)
         
+        if _serper_breaker.is_open():
+            logger.warning(f"⚠️ Serper circuit open - skipping search for: {query}")
+            return []
+        
         try:
-            headers = {
-                "X-API-KEY": self.serper_api_key,
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "q": query,
                 "num": max_results
             }
             
             logger.debug(f"🔎 Calling Serper API for: {query}")
-            response = requests.post(
+            response = self._request_with_retry(
+                "POST",
                 self.serper_url,
-                headers=headers,
+                headers=self._serper_headers,
                 json=payload,
                 timeout=self.request_timeout
             )
             response.raise_for_status()
+            _serper_breaker.record_success()
             
-            data = response.json()
+            return self._parse_serper_response(_json_loads(response.content), max_results)
             
-            # Extract organic results
-            results = []
-            organic_results = data.get("organic", [])
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Serper API error: {e}")
+            _serper_breaker.record_failure()
+            return self._fallback_search(query, max_results)
+        except Exception as e:
+            logger.error(f"Unexpected error in Serper search: {e}")
+            return []
+    
+    async def _async_search_with_serper(self, query: str, max_results: int) -> List[Dict]:
+        """Async variant of _search_with_serper() using the shared httpx client"""
+        if not self.serper_api_key:
+            logger.warning("SERPER_API_KEY not available. Using fallback search.")
+            return self._fallback_search(query, max_results)
+        
+        if _serper_breaker.is_open():
+            logger.warning(f"⚠️ Serper circuit open - skipping search for: {query}")
+            return []
+        
+        try:
+            payload = {
+                "q": query,
+                "num": max_results
+            }
             
-            for item in organic_results[:max_results]:
-                result = {
-                    "title": item.get("title", ""),
-                    "url": item.get("link", ""),
-                    "snippet": item.get("snippet", ""),
-                    "source": item.get("source", "serper"),
-                    "position": item.get("position", 0)
-                }
-                results.append(result)
+            logger.debug(f"🔎 Calling Serper API for: {query}")
+            response = await self._arequest_with_retry(
+                "POST",
+                self.serper_url,
+                headers=self._serper_headers,
+                json=payload
+            )
+            response.raise_for_status()
+            _serper_breaker.record_success()
             
-            logger.info(f"✅ Serper returned {len(results)} results")
-            return results
+            return self._parse_serper_response(_json_loads(response.content), max_results)
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Serper API error: {e}")
+            _serper_breaker.record_failure()
             return self._fallback_search(query, max_results)
         except Exception as e:
             logger.error(f"Unexpected error in Serper search: {e}")
             return []
     
+    def _parse_serper_response(self, data: Dict, max_results: int) -> List[Dict]:
+        """Extract organic results from a Serper response body"""
+        results = []
+        organic_results = data.get("organic", [])
+        
+        for item in organic_results[:max_results]:
+            result = {
+                "title": item.get("title", ""),
+                "url": item.get("link", ""),
+                "snippet": item.get("snippet", ""),
+                "source": item.get("source", "serper"),
+                "position": item.get("position", 0)
+            }
+            results.append(result)
+        
+        logger.info(f"✅ Serper returned {len(results)} results")
+        return results
+    
     # ==================== Crawling Layer (Firecrawl) ====================
     
     def _enrich_with_firecrawl(self, serp_results: List[Dict], query: str) -> List[Dict]:
@@ -281,6 +1328,9 @@ class WebSearchTool:
         Returns:
             Enriched results with full_content from Firecrawl
         """
+        # Drop duplicate URLs up front so they are never scraped twice
+        serp_results = self._dedupe_by_url(serp_results)
+        
         if not self.firecrawl_api_key:
             logger.warning("⚠️ FIRECRAWL_API_KEY not available. Skipping deep scraping - using snippets only.")
             logger.warning("   To enable Firecrawl, set FIRECRAWL_API_KEY in your .env file")
@@ -292,37 +1342,132 @@ class WebSearchTool:
             return serp_results
         
         logger.info(f"🕷️ Enriching {len(serp_results)} SERP results with Firecrawl (scraping top {self.top_urls_to_scrape} URLs)")
-        enriched_results = []
-        
         # Scrape top N URLs
         urls_to_scrape = serp_results[:self.top_urls_to_scrape]
+        
+        scrape_targets = [(i, r.get("url", "")) for i, r in enumerate(urls_to_scrape) if r.get("url", "")]
+        scraped = {}
+        
+        # Serve previously scraped URLs from cache
+        for i, url in scrape_targets:
+            cached = self._get_cached_scrape(url)
+            if cached:
+                scraped[i] = cached
+        scrape_targets = [(i, url) for i, url in scrape_targets if i not in scraped]
+        
+        # One batch job for all top URLs; anything it misses is scraped individually
+        if self.firecrawl_batch_scrape and len(scrape_targets) > 1:
+            batch_contents = self._batch_scrape_with_firecrawl([url for _, url in scrape_targets])
+            for i, url in scrape_targets:
+                if batch_contents.get(url):
+                    scraped[i] = batch_contents[url]
+            scrape_targets = [(i, url) for i, url in scrape_targets if i not in scraped]
+        
+        # Scraping is I/O bound - fetch the top URLs concurrently, bounded by the plan limit
+        if scrape_targets:
+            workers = min(len(scrape_targets), self.firecrawl_concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    i: executor.submit(self._scrape_url_logged, i, len(urls_to_scrape), url)
+                    for i, url in scrape_targets
+                }
+                for i, future in futures.items():
+                    try:
+                        scraped[i] = future.result()
+                    except Exception as e:
+                        scraped[i] = e
+        
+        return self._merge_scraped_content(serp_results, scraped, len(urls_to_scrape))
+    
+    async def _aenrich_with_firecrawl(self, serp_results: List[Dict], query: str) -> List[Dict]:
+        """Async variant of _enrich_with_firecrawl() - top URLs are scraped concurrently"""
+        serp_results = self._dedupe_by_url(serp_results)
+        
+        if not self.firecrawl_api_key:
+            logger.warning("⚠️ FIRECRAWL_API_KEY not available. Skipping deep scraping - using snippets only.")
+            for result in serp_results:
+                result["full_content"] = result.get("snippet", "")
+                result["source"] = "serper"
+            return serp_results
+        
+        logger.info(f"🕷️ Enriching {len(serp_results)} SERP results with Firecrawl (scraping top {self.top_urls_to_scrape} URLs)")
+        urls_to_scrape = serp_results[:self.top_urls_to_scrape]
+        scrape_targets = [(i, r.get("url", "")) for i, r in enumerate(urls_to_scrape) if r.get("url", "")]
+        scraped = {}
+        
+        # Serve previously scraped URLs from cache
+        for i, url in scrape_targets:
+            cached = self._get_cached_scrape(url)
+            if cached:
+                scraped[i] = cached
+        scrape_targets = [(i, url) for i, url in scrape_targets if i not in scraped]
+        
+        # One batch job for all top URLs; anything it misses is scraped individually
+        if self.firecrawl_batch_scrape and len(scrape_targets) > 1:
+            batch_contents = await self._async_batch_scrape_with_firecrawl([url for _, url in scrape_targets])
+            for i, url in scrape_targets:
+                if batch_contents.get(url):
+                    scraped[i] = batch_contents[url]
+            scrape_targets = [(i, url) for i, url in scrape_targets if i not in scraped]
+        
+        contents = await asyncio.gather(
+            *[self._async_scrape_with_firecrawl(url) for _, url in scrape_targets],
+            return_exceptions=True
+        )
+        scraped.update({i: content for (i, _), content in zip(scrape_targets, contents)})
+        
+        return self._merge_scraped_content(serp_results, scraped, len(urls_to_scrape))
+    
+    def _dedupe_by_url(self, results: List[Dict]) -> List[Dict]:
+        """Keep the first result for each URL (results without a URL are kept)"""
+        seen_urls = set()
+        unique_results = []
+        for result in results:
+            url = result.get("url", "")
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+            unique_results.append(result)
+        return unique_results
+    
+    def _merge_scraped_content(self, serp_results: List[Dict], scraped: Dict[int, Any], attempted: int) -> List[Dict]:
+        """
+        Merge scraped page content back into SERP results by index
+        
+        Args:
+            serp_results: List of SERP results from Serper
+            scraped: Map of SERP index to scraped content (or the exception raised)
+            attempted: Number of top URLs that were considered for scraping
+            
+        Returns:
+            Enriched results with full_content (snippet fallback where scraping failed)
+        """
+        enriched_results = []
         successful_scrapes = 0
         failed_scrapes = 0
         
         for i, result in enumerate(serp_results):
             url = result.get("url", "")
             
-            # Scrape top URLs with Firecrawl
-            if i < len(urls_to_scrape) and url:
-                try:
-                    logger.info(f"🕷️ Scraping {i+1}/{len(urls_to_scrape)} with Firecrawl: {url}")
-                    full_content = self._scrape_with_firecrawl(url)
-                    
-                    if full_content and len(full_content.strip()) > 100:
-                        result["full_content"] = full_content
-                        result["source"] = "serper + firecrawl"
-                        successful_scrapes += 1
-                        logger.info(f"✅ Successfully scraped {url} ({len(full_content)} chars)")
-                    else:
-                        result["full_content"] = result.get("snippet", "")
-                        result["source"] = "serper"
-                        failed_scrapes += 1
-                        logger.warning(f"⚠️ Firecrawl returned insufficient content for {url}, using snippet")
-                except Exception as e:
-                    logger.warning(f"Error scraping {url} with Firecrawl: {e}")
+            # Use Firecrawl content for top URLs
+            if i in scraped:
+                full_content = scraped[i]
+                if isinstance(full_content, BaseException):
+                    logger.warning(f"Error scraping {url} with Firecrawl: {full_content}")
+                    result["full_content"] = result.get("snippet", "")
+                    result["source"] = "serper"
+                    failed_scrapes += 1
+                elif full_content and len(full_content.strip()) > 100:
+                    result["full_content"] = full_content
+                    result["source"] = "serper + firecrawl"
+                    successful_scrapes += 1
+                    logger.info(f"✅ Successfully scraped {url} ({len(full_content)} chars)")
+                else:
                     result["full_content"] = result.get("snippet", "")
                     result["source"] = "serper"
                     failed_scrapes += 1
+                    logger.warning(f"⚠️ Firecrawl returned insufficient content for {url}, using snippet")
             else:
                 # For non-top URLs, use snippet as full_content
                 result["full_content"] = result.get("snippet", "")
@@ -330,14 +1475,164 @@ class WebSearchTool:
             
             enriched_results.append(result)
         
-        logger.info(f"✅ Firecrawl enrichment complete: {successful_scrapes} successful, {failed_scrapes} failed out of {len(urls_to_scrape)} attempts")
+        logger.info(f"✅ Firecrawl enrichment complete: {successful_scrapes} successful, {failed_scrapes} failed out of {attempted} attempts")
         return enriched_results
     
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=1, max=5),
-        retry=retry_if_exception_type((requests.exceptions.RequestException, TimeoutError))
-    )
+    def _batch_scrape_with_firecrawl(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Scrape several URLs with one Firecrawl batch job (submit, then poll until done)
+        
+        Args:
+            urls: URLs to scrape
+            
+        Returns:
+            Map of URL to clean text content (URLs that failed are omitted)
+        """
+        if _firecrawl_breaker.is_open():
+            return {}
+        
+        try:
+            logger.info(f"🕷️ Submitting Firecrawl batch scrape for {len(urls)} URLs")
+            response = self._request_with_retry(
+                "POST",
+                self.firecrawl_batch_url,
+                attempts=self.firecrawl_attempts,
+                headers=self._firecrawl_headers,
+                json=self._batch_scrape_payload(urls),
+                timeout=self.request_timeout
+            )
+            response.raise_for_status()
+            _firecrawl_breaker.record_success()
+            job = _json_loads(response.content)
+            status_url = job.get("url") or f"{self.firecrawl_batch_url}/{job.get('id')}"
+            
+            items = []
+            partial = []
+            deadline = time.monotonic() + self.request_timeout
+            while time.monotonic() < deadline:
+                time.sleep(self.batch_poll_interval)
+                response = self._session.get(status_url, headers=self._firecrawl_headers, timeout=self.request_timeout)
+                response.raise_for_status()
+                status = _json_loads(response.content)
+                if status.get("status") == "completed":
+                    items.extend(status.get("data") or [])
+                    # Large jobs are paginated
+                    while status.get("next"):
+                        response = self._session.get(status["next"], headers=self._firecrawl_headers, timeout=self.request_timeout)
+                        response.raise_for_status()
+                        status = _json_loads(response.content)
+                        items.extend(status.get("data") or [])
+                    break
+                if status.get("status") == "failed":
+                    logger.warning("Firecrawl batch scrape job failed")
+                    break
+                # Documents finished so far - kept if the job outlives the deadline
+                partial = status.get("data") or partial
+            else:
+                logger.warning(
+                    f"Firecrawl batch scrape did not finish within {self.request_timeout}s - "
+                    f"keeping {len(partial)} finished documents"
+                )
+                items = partial
+            
+            return self._parse_batch_scrape_items(items, urls)
+            
+        except Exception as e:
+            self._record_firecrawl_error(e)
+            logger.warning(f"Firecrawl batch scrape error, falling back to per-URL scraping: {e}")
+            return {}
+    
+    async def _async_batch_scrape_with_firecrawl(self, urls: List[str]) -> Dict[str, str]:
+        """Async variant of _batch_scrape_with_firecrawl() using the shared httpx client"""
+        if _firecrawl_breaker.is_open():
+            return {}
+        
+        client = self._get_http_client()
+        
+        try:
+            logger.info(f"🕷️ Submitting Firecrawl batch scrape for {len(urls)} URLs")
+            response = await self._arequest_with_retry(
+                "POST",
+                self.firecrawl_batch_url,
+                attempts=self.firecrawl_attempts,
+                headers=self._firecrawl_headers,
+                json=self._batch_scrape_payload(urls)
+            )
+            response.raise_for_status()
+            _firecrawl_breaker.record_success()
+            job = _json_loads(response.content)
+            status_url = job.get("url") or f"{self.firecrawl_batch_url}/{job.get('id')}"
+            
+            items = []
+            partial = []
+            deadline = time.monotonic() + self.request_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.batch_poll_interval)
+                response = await client.get(status_url, headers=self._firecrawl_headers)
+                response.raise_for_status()
+                status = _json_loads(response.content)
+                if status.get("status") == "completed":
+                    items.extend(status.get("data") or [])
+                    # Large jobs are paginated
+                    while status.get("next"):
+                        response = await client.get(status["next"], headers=self._firecrawl_headers)
+                        response.raise_for_status()
+                        status = _json_loads(response.content)
+                        items.extend(status.get("data") or [])
+                    break
+                if status.get("status") == "failed":
+                    logger.warning("Firecrawl batch scrape job failed")
+                    break
+                # Documents finished so far - kept if the job outlives the deadline
+                partial = status.get("data") or partial
+            else:
+                logger.warning(
+                    f"Firecrawl batch scrape did not finish within {self.request_timeout}s - "
+                    f"keeping {len(partial)} finished documents"
+                )
+                items = partial
+            
+            # Preprocessing is CPU work - keep it off the event loop
+            return await asyncio.to_thread(self._parse_batch_scrape_items, items, urls)
+            
+        except Exception as e:
+            self._record_firecrawl_error(e)
+            logger.warning(f"Firecrawl batch scrape error, falling back to per-URL scraping: {e}")
+            return {}
+    
+    def _batch_scrape_payload(self, urls: List[str]) -> Dict:
+        """Build the Firecrawl batch scrape request body"""
+        return {
+            "urls": urls,
+            "formats": ["markdown"],
+            "onlyMainContent": True
+        }
+    
+    def _parse_batch_scrape_items(self, items: List[Dict], urls: List[str]) -> Dict[str, str]:
+        """Map batch scrape documents back to the requested URLs and preprocess them"""
+        # Firecrawl may normalize URLs (e.g. trailing slash) - match on a relaxed key too
+        requested = {url.rstrip('/'): url for url in urls}
+        contents = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            metadata = item.get("metadata") or {}
+            source_url = metadata.get("sourceURL") or metadata.get("url") or ""
+            url = requested.get(source_url.rstrip('/'))
+            if not url or url in contents:
+                continue
+            content = self._extract_firecrawl_content({"success": True, "data": item}, url)
+            if content:
+                contents[url] = content
+                self._set_cached_scrape(url, content)
+        logger.info(f"✅ Firecrawl batch scrape returned content for {len(contents)}/{len(urls)} URLs")
+        return contents
+    
+    def _scrape_url_logged(self, i: int, total: int, url: str) -> Optional[str]:
+        """Scrape one of the top URLs (runs on a worker thread)"""
+        logger.info(f"🕷️ Scraping {i+1}/{total} with Firecrawl: {url}")
+        return self._scrape_with_firecrawl(url)
+    
     def _scrape_with_firecrawl(self, url: str) -> Optional[str]:
         """
         Scrape URL using Firecrawl.dev API with preprocessing pipeline
@@ -352,108 +1647,425 @@ class WebSearchTool:
             logger.debug(f"FIRECRAWL_API_KEY not available. Cannot scrape {url}")
             return None
         
+        cached = self._get_cached_scrape(url)
+        if cached:
+            return cached
+        
+        if _firecrawl_breaker.is_open():
+            logger.debug(f"Firecrawl circuit open - skipping scrape of {url}")
+            return None
+        
         try:
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_api_key}",
-                "Content-Type": "application/json"
-            }
-            
             # Updated payload structure for Firecrawl API v1
             payload = {
                 "url": url,
-                "formats": ["markdown", "html"],
+                "formats": ["markdown"],  # Markdown only - HTML doubles payload size and render time
                 "onlyMainContent": True
             }
             
             logger.debug(f"🕷️ Calling Firecrawl API for: {url}")
-            response = requests.post(
+            response = self._request_with_retry(
+                "POST",
                 self.firecrawl_url,
-                headers=headers,
+                attempts=self.firecrawl_attempts,
+                headers=self._firecrawl_headers,
                 json=payload,
-                timeout=self.request_timeout
+                timeout=self.request_timeout,
+                stream=IJSON_AVAILABLE
             )
             
             # Log response status for debugging
             logger.debug(f"Firecrawl API response status: {response.status_code}")
             
             response.raise_for_status()
+            _firecrawl_breaker.record_success()
+            
+            # Stream just the markdown out of large responses when ijson is available
+            data = self._read_firecrawl_stream(response) if IJSON_AVAILABLE else _json_loads(response.content)
+            content = self._extract_firecrawl_content(data, url)
+            self._set_cached_scrape(url, content)
+            return content
+            
+        except requests.exceptions.HTTPError as e:
+            self._record_firecrawl_error(e)
+            error_detail = ""
+            try:
+                error_response = _json_loads(e.response.content)
+                error_detail = error_response.get("error", {}).get("message", str(e))
+            except:
+                error_detail = str(e)
+            logger.warning(f"Firecrawl API HTTP error for {url}: {error_detail} (Status: {e.response.status_code})")
+            return None
+        except requests.exceptions.RequestException as e:
+            self._record_firecrawl_error(e)
+            logger.warning(f"Firecrawl API request error for {url}: {e}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.warning(f"Firecrawl API returned invalid JSON for {url}: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Unexpected error scraping {url} with Firecrawl: {e}", exc_info=True)
+            return None
+    
+    def _read_firecrawl_stream(self, response: requests.Response) -> Dict:
+        """
+        Extract only data.markdown from a streamed Firecrawl response without
+        materializing the full response body or dict
+        
+        Args:
+            response: Streamed (stream=True) successful scrape response
+            
+        Returns:
+            Minimal success/data structure for _extract_firecrawl_content(), or {} if no markdown
+        """
+        try:
+            response.raw.decode_content = True  # Let urllib3 undo gzip/deflate
+            markdown = next(ijson.items(response.raw, "data.markdown"), None)
+        finally:
+            response.close()
+        
+        if not markdown:
+            return {}
+        return {"success": True, "data": {"markdown": markdown}}
+    
+    async def _async_scrape_with_firecrawl(self, url: str) -> Optional[str]:
+        """Async variant of _scrape_with_firecrawl() using the shared httpx client"""
+        if not self.firecrawl_api_key:
+            logger.debug(f"FIRECRAWL_API_KEY not available. Cannot scrape {url}")
+            return None
+        
+        cached = self._get_cached_scrape(url)
+        if cached:
+            return cached
+        
+        if _firecrawl_breaker.is_open():
+            logger.debug(f"Firecrawl circuit open - skipping scrape of {url}")
+            return None
+        
+        try:
+            # Updated payload structure for Firecrawl API v1
+            payload = {
+                "url": url,
+                "formats": ["markdown"],
+                "onlyMainContent": True
+            }
+            
+            # Bound concurrent scrapes to the plan's limit (shrinks while Firecrawl rate limits us)
+            logger.info(f"🕷️ Scraping with Firecrawl: {url}")
+            response = await self._arequest_with_retry(
+                "POST",
+                self.firecrawl_url,
+                attempts=self.firecrawl_attempts,
+                limiter=self._get_firecrawl_limiter(),
+                headers=self._firecrawl_headers,
+                json=payload
+            )
+            logger.debug(f"Firecrawl API response status: {response.status_code}")
+            response.raise_for_status()
+            _firecrawl_breaker.record_success()
+            
+            # Preprocessing is CPU work - keep it off the event loop
+            content = await asyncio.to_thread(self._extract_firecrawl_content, _json_loads(response.content), url)
+            self._set_cached_scrape(url, content)
+            return content
+            
+        except httpx.HTTPStatusError as e:
+            self._record_firecrawl_error(e)
+            logger.warning(f"Firecrawl API HTTP error for {url}: {e} (Status: {e.response.status_code})")
+            return None
+        except httpx.HTTPError as e:
+            self._record_firecrawl_error(e)
+            logger.warning(f"Firecrawl API request error for {url}: {e}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.warning(f"Firecrawl API returned invalid JSON for {url}: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Unexpected error scraping {url} with Firecrawl: {e}", exc_info=True)
+            return None
+    
+    def _get_cached_scrape(self, url: str) -> Optional[str]:
+        """
+        Look up previously scraped content for a URL
+        
+        Args:
+            url: URL to look up
             
-            data = response.json()
-            
-            # Log response structure for debugging
-            logger.debug(f"Firecrawl API response keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
-            
-            # Handle different response structures
-            # Firecrawl v1 can return data directly or wrapped in success/data structure
-            result = None
-            raw_content = None
-            
-            if isinstance(data, dict):
-                # Check for success/data structure
-                if data.get("success") is True:
-                    result = data.get("data", {})
-                    if isinstance(result, dict):
-                        # Prefer markdown, fallback to html
-                        raw_content = result.get("markdown") or result.get("html", "") or result.get("content", "")
-                # Check if data is directly in response (alternative structure)
-                elif "markdown" in data or "html" in data or "content" in data:
-                    result = data
-                    raw_content = result.get("markdown") or result.get("html", "") or result.get("content", "")
-                # Check for error structure
-                elif "error" in data:
-                    error_msg = data.get("error", "Unknown error")
-                    logger.warning(f"Firecrawl API returned error for {url}: {error_msg}")
+        Returns:
+            Cached clean text content, or None on a miss
+        """
+        if self._scrape_cache is None:
+            return None
+        
+        key = hashlib.sha256(url.encode()).hexdigest()
+        try:
+            if self._scrape_cache_on_disk:
+                entry = self._scrape_cache.get(key)
+                if entry is None:
+                    return None
+                content, scraped_at = entry
+                # Entries written under a longer TTL are stale now
+                if scraped_at < time.time() - self.scrape_cache_ttl:
                     return None
+            else:
+                with self._scrape_cache_lock:
+                    entry = self._scrape_cache.get(key)
+                    if entry is None:
+                        return None
+                    content, expires_at = entry
+                    if expires_at <= time.monotonic():
+                        del self._scrape_cache[key]
+                        return None
+                    self._scrape_cache.move_to_end(key)
+        except Exception as e:
+            logger.debug(f"Scrape cache lookup failed for {url}: {e}")
+            return None
+        
+        if content:
+            logger.info(f"♻️ Using cached Firecrawl content for {url}")
+        return content
+    
+    def _set_cached_scrape(self, url: str, content: Optional[str]) -> None:
+        """Cache scraped content for a URL (empty results are not cached)"""
+        if self._scrape_cache is None or not content:
+            return
+        
+        key = hashlib.sha256(url.encode()).hexdigest()
+        try:
+            if self._scrape_cache_on_disk:
+                self._scrape_cache.set(key, (content, time.time()), expire=self.scrape_cache_ttl)
+            else:
+                with self._scrape_cache_lock:
+                    self._scrape_cache[key] = (content, time.monotonic() + self.scrape_cache_ttl)
+                    self._scrape_cache.move_to_end(key)
+                    # Evict least recently used entries
+                    while len(self._scrape_cache) > self.scrape_cache_max_entries:
+                        self._scrape_cache.popitem(last=False)
+        except Exception as e:
+            logger.debug(f"Scrape cache store failed for {url}: {e}")
+    
+    def _record_firecrawl_error(self, error: Exception) -> None:
+        """
+        Feed a Firecrawl request error to the circuit breaker
+        
+        Transport errors, 5xx and 429 count as upstream failures; other 4xx
+        responses are per-URL problems (blocked or unsupported pages) and do not
+        """
+        if not isinstance(error, (requests.exceptions.RequestException, httpx.HTTPError)):
+            return
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        if status_code is None or status_code >= 500 or status_code == 429:
+            _firecrawl_breaker.record_failure()
+    
+    def _retry_delay(self, attempt: int, response: Any = None) -> float:
+        """
+        Seconds to wait before the next attempt
+        
+        Args:
+            attempt: Zero-based attempt that just failed
+            response: Failed response, if any (its Retry-After header wins when present)
+            
+        Returns:
+            Server-requested delay (capped at max_retry_after), else exponential backoff (2s, 4s, 8s... max 10s)
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(max(float(retry_after), 0.0), self.max_retry_after)
+                except ValueError:
+                    pass  # HTTP-date form - fall back to backoff
+        return min(2 ** (attempt + 1), 10)
+    
+    def _request_with_retry(self, method: str, url: str, attempts: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session, retrying transient failures
+        
+        Rate limiting/overload responses (429, 502, 503, 504) honor the server's
+        Retry-After header; connection errors and timeouts use exponential backoff.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            attempts: Maximum attempts (defaults to max_retries)
+            **kwargs: Passed through to requests.Session.request()
+            
+        Returns:
+            The final response (callers still call raise_for_status())
+        """
+        attempts = attempts or self.max_retries
+        kwargs = _encode_json_body(kwargs, "data")  # Encoded once, reused across retries
+        for attempt in range(attempts):
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"⏳ {method} {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == attempts - 1:
+                    return response
+                delay = self._retry_delay(attempt, response)
+                response.close()
+                logger.warning(f"⏳ {method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+    
+    async def _arequest_with_retry(
+        self,
+        method: str,
+        url: str,
+        attempts: Optional[int] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Async variant of _request_with_retry() using the shared httpx client
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            attempts: Maximum attempts (defaults to max_retries)
+            limiter: Optional concurrency limiter held only while a request is in flight
+            **kwargs: Passed through to httpx.AsyncClient.request()
+            
+        Returns:
+            The final response (callers still call raise_for_status())
+        """
+        attempts = attempts or self.max_retries
+        kwargs = _encode_json_body(kwargs, "content")  # Encoded once, reused across retries
+        client = self._get_http_client()
+        for attempt in range(attempts):
+            try:
+                async with (limiter or contextlib.nullcontext()):
+                    response = await client.request(method, url, **kwargs)
+                    if limiter is not None:
+                        if response.status_code == 429:
+                            limiter.record_rate_limited()
+                        else:
+                            limiter.record_success()
+            except httpx.TransportError as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(f"⏳ {method} {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == attempts - 1:
+                    return response
+                delay = self._retry_delay(attempt, response)
+                logger.warning(f"⏳ {method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    def _bind_event_loop(self) -> None:
+        """Drop async resources created on a different (finished) event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._http = None
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared async HTTP client, or lazily create a pooled one for this loop"""
+        self._bind_event_loop()
+        if self._shared_http is not None and self._loop is self._shared_http_loop and not self._shared_http.is_closed:
+            return self._shared_http
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=self.request_timeout)
+        return self._http
+    
+    def _get_firecrawl_limiter(self) -> "AdaptiveConcurrencyLimiter":
+        """Get the process-wide limiter bounding concurrent Firecrawl scrapes on this loop"""
+        return _get_firecrawl_limiter(self.firecrawl_concurrency)
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client"""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+    
+    def _extract_firecrawl_content(self, data: Any, url: str) -> Optional[str]:
+        """
+        Extract and preprocess page content from a Firecrawl scrape response body
+        
+        Args:
+            data: Parsed JSON response from Firecrawl
+            url: URL that was scraped
             
-            if not raw_content:
-                logger.debug(f"No content extracted from Firecrawl response for {url}")
+        Returns:
+            Clean text content of the page, or None if no content
+        """
+        # Log response structure for debugging
+        logger.debug(f"Firecrawl API response keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
+        
+        # Handle different response structures
+        # Firecrawl v1 can return data directly or wrapped in success/data structure
+        result = None
+        raw_content = None
+        
+        if isinstance(data, dict):
+            # Check for success/data structure
+            if data.get("success") is True:
+                result = data.get("data", {})
+                if isinstance(result, dict):
+                    raw_content = result.get("markdown") or result.get("content", "")
+            # Check if data is directly in response (alternative structure)
+            elif "markdown" in data or "content" in data:
+                result = data
+                raw_content = result.get("markdown") or result.get("content", "")
+            # Check for error structure
+            elif "error" in data:
+                error_msg = data.get("error", "Unknown error")
+                logger.warning(f"Firecrawl API returned error for {url}: {error_msg}")
                 return None
+        
+        if not raw_content:
+            logger.debug(f"No content extracted from Firecrawl response for {url}")
+            return None
+        
+        logger.debug(f"✅ Extracted {len(raw_content)} chars from Firecrawl for {url}")
+        
+        # Identical pages (canonical docs, mirrors) skip the preprocessing pipeline
+        content_key = hashlib.sha256(raw_content.encode()).digest()
+        with self._preproc_cache_lock:
+            cached = self._preproc_cache.get(content_key)
+            if cached is not None:
+                self._preproc_cache.move_to_end(content_key)
+                return cached
+        
+        text = self._preprocess_raw_content(raw_content, url)
+        with self._preproc_cache_lock:
+            self._preproc_cache[content_key] = text
+            if len(self._preproc_cache) > self.preproc_cache_max_entries:
+                self._preproc_cache.popitem(last=False)
+        return text
+    
+    def _preprocess_raw_content(self, raw_content: str, url: str) -> str:
+        """
+        Run scraped markdown through the preprocessing pipeline, in the CPU
+        worker pool when one is configured (parallel scrapes otherwise serialize on the GIL)
+        
+        Args:
+            raw_content: Raw markdown from Firecrawl
+            url: URL that was scraped
             
-            logger.debug(f"✅ Extracted {len(raw_content)} chars from Firecrawl for {url}")
-            
-            # Use preprocessing pipeline for clean extraction
-            content_type = "markdown" if result and result.get("markdown") else "html"
-            try:
-                processed = self.preprocessor.preprocess(
-                    content=raw_content,
-                    content_type=content_type,
-                    url=url
-                )
-                
-                cleaned_text = processed.get("text", "") if isinstance(processed, dict) else str(processed)
-                if cleaned_text and len(cleaned_text.strip()) > 50:
-                    return cleaned_text[:10000]  # Limit to 10k chars
-                else:
-                    logger.debug(f"Preprocessed content too short for {url}: {len(cleaned_text)} chars")
-                    # Fallback: use raw content if preprocessing fails
-                    return raw_content[:10000]
-            except Exception as preprocess_error:
-                logger.warning(f"Preprocessing failed for {url}, using raw content: {preprocess_error}")
-                # Fallback: use raw content if preprocessing fails
-                return raw_content[:10000]
-            
-        except requests.exceptions.HTTPError as e:
-            error_detail = ""
+        Returns:
+            Clean text (up to 10k chars), or the raw content if preprocessing fails
+        """
+        cpu_pool = self._get_cpu_pool()
+        if cpu_pool is not None:
             try:
-                error_response = e.response.json()
-                error_detail = error_response.get("error", {}).get("message", str(e))
-            except:
-                error_detail = str(e)
-            logger.warning(f"Firecrawl API HTTP error for {url}: {error_detail} (Status: {e.response.status_code})")
-            return None
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Firecrawl API request error for {url}: {e}")
-            return None
-        except json.JSONDecodeError as e:
-            logger.warning(f"Firecrawl API returned invalid JSON for {url}: {e}")
-            return None
-        except Exception as e:
-            logger.warning(f"Unexpected error scraping {url} with Firecrawl: {e}", exc_info=True)
-            return None
+                return cpu_pool.submit(_preprocess_markdown, raw_content, url).result()
+            except Exception as e:
+                logger.warning(f"Preprocessing worker failed for {url}, preprocessing inline: {e}")
+        return _preprocess_markdown(raw_content, url, self.preprocessor)
+    
+    def _get_cpu_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get the process-wide pool for CPU-bound preprocessing (None if disabled)"""
+        return _get_cpu_pool(self.preprocess_workers)
     
     # ==================== Intelligence Layer (LLM) ====================
     
-    def _process_with_llm(self, results: List[Dict], query: str) -> List[Dict]:
+    def _process_with_llm(self, results: List[Dict], query: str, top_k: Optional[int] = None) -> List[Dict]:
         """
         Post-process results with LLM for:
         - Summarization
@@ -464,6 +2076,7 @@ class WebSearchTool:
         Args:
             results: List of enriched search results
             query: Original search query
+            top_k: Only return the top_k most confident results (None = all)
             
         Returns:
             Processed and ranked results (always returns at least the original results)
@@ -477,231 +2090,292 @@ class WebSearchTool:
             # If no LLM, return results with basic confidence scores
             return self._create_basic_results(results)
         
-        # Always prepare fallback results first
-        fallback_results = []
-        for result in results:
-            fallback_results.append({
-                "title": result.get("title", ""),
-                "url": result.get("url", ""),
-                "snippet": result.get("snippet", ""),
-                "full_content": result.get("full_content", ""),
-                "source": result.get("source", "serper + firecrawl"),
-                "source_type": "web_search",
-                "confidence": 0.8,
-                "key_facts": []
-            })
-        
         try:
             logger.debug(f"🧠 Processing {len(results)} results with LLM")
+            batches = self._build_llm_batches(results, query)
             
-            # Process in smaller batches to avoid MAX_TOKENS truncation
-            # Limit to 3 results per batch to keep prompt size very small
-            BATCH_SIZE = 3
-            MAX_CONTENT_LENGTH = 150  # Very short to prevent truncation
-            MAX_SNIPPET_LENGTH = 100  # Very short
-            
-            all_processed_results = []
-            
-            # Process results in batches
-            for batch_start in range(0, len(results), BATCH_SIZE):
-                batch_end = min(batch_start + BATCH_SIZE, len(results))
-                batch_results = results[batch_start:batch_end]
-                
-                logger.debug(f"Processing batch {batch_start//BATCH_SIZE + 1}: results {batch_start}-{batch_end-1}")
-                
-                # Prepare context for LLM - use much shorter content
-                results_context = []
-                for i, result in enumerate(batch_results):
-                    # Use only essential information to keep prompt short
-                    snippet = result.get("snippet", "")[:MAX_SNIPPET_LENGTH]
-                    full_content = result.get("full_content", "")
-                    # Take first paragraph or first 300 chars, whichever is shorter
-                    if full_content:
-                        # Get first sentence or first 300 chars
-                        first_sentence = full_content.split('.')[0][:MAX_CONTENT_LENGTH]
-                        content_preview = first_sentence if len(first_sentence) < MAX_CONTENT_LENGTH else full_content[:MAX_CONTENT_LENGTH]
-                    else:
-                        content_preview = snippet[:MAX_CONTENT_LENGTH]
-                    
-                    results_context.append({
-                        "index": batch_start + i,  # Keep original index
-                        "title": result.get("title", "")[:100],  # Limit title length
-                        "snippet": snippet,
-                        "preview": content_preview  # Much shorter preview
-                    })
-                
-                # Create simplified, more reliable prompt
-                # Build a simpler context string
-                results_text = ""
-                for i, ctx in enumerate(results_context):
-                    results_text += f"\nResult {i}:\nTitle: {ctx.get('title', '')}\nSnippet: {ctx.get('snippet', '')}\n"
-                
-                prompt = f"""Analyze these {len(batch_results)} search results for the query: "{query}"
-
-{results_text}
-
-For each result, provide:
-- A relevance confidence score (0.0 to 1.0)
-- A brief 2-3 sentence summary
-- 2-3 key facts
-
-Return ONLY a valid JSON array in this exact format:
-[
-  {{"index": 0, "confidence": 0.95, "summary": "Brief summary here", "key_facts": ["fact1", "fact2"]}},
-  {{"index": 1, "confidence": 0.90, "summary": "Brief summary here", "key_facts": ["fact1", "fact2"]}}
-]
-
-Important: Return ONLY the JSON array, no markdown code blocks, no explanations, no text before or after."""
-                
-                # Skip LLM processing if batch is too large - just use original results
-                # This prevents MAX_TOKENS issues
-                if len(batch_results) > BATCH_SIZE:
-                    logger.warning(f"Batch too large, skipping LLM processing for batch {batch_start//BATCH_SIZE + 1}")
-                    raise ValueError("Batch too large")
-                
-                # Try with optimized prompt and higher token limit
+            analyses = []
+            for batch_num, (_, batch_results, prompt) in enumerate(batches, 1):
+                if not self._needs_llm(batch_results):
+                    analyses.append(None)
+                    continue
                 try:
-                    logger.debug(f"Calling LLM for batch {batch_start//BATCH_SIZE + 1} with prompt length: {len(prompt)}")
-                    response = self.llm_engine.generate(
-                        prompt=prompt,
-                        system_prompt="You are a helpful assistant. Return ONLY valid JSON array, no markdown, no explanations.",
-                        temperature=0.3,
-                        max_tokens=4000,  # Increased to prevent truncation
-                        timeout=30
-                    )
-                    
-                    if not response or len(response.strip()) == 0:
-                        logger.warning(f"Empty response from LLM for batch {batch_start//BATCH_SIZE + 1}")
-                        raise ValueError("Empty response from LLM")
-                    
-                    logger.debug(f"LLM response length: {len(response)}, preview: {response[:200]}")
-                    
-                    # Parse LLM response for this batch
-                    batch_analysis = self._parse_llm_response(response)
-                    
-                    if not batch_analysis:
-                        logger.warning(f"Failed to parse LLM response for batch {batch_start//BATCH_SIZE + 1}, using original results")
-                        raise ValueError("Failed to parse LLM response")
-                    
-                    # Reset failure count on success
-                    self.llm_failure_count = 0
-                    
-                    # Merge batch analysis with results
-                    for i, result in enumerate(batch_results):
-                        original_index = batch_start + i
-                        analysis = batch_analysis.get(original_index, {})
-                        
-                        processed_result = {
-                            "title": result.get("title", ""),
-                            "url": result.get("url", ""),
-                            "snippet": analysis.get("summary", result.get("snippet", "")),
-                            "full_content": result.get("full_content", ""),
-                            "source": result.get("source", "serper + firecrawl"),
-                            "source_type": "web_search",
-                            "confidence": analysis.get("confidence", 0.8),
-                            "key_facts": analysis.get("key_facts", [])
-                        }
-                        
-                        all_processed_results.append(processed_result)
-                        
-                except ValueError as e:
-                    error_msg = str(e)
-                    self.llm_failure_count += 1
-                    logger.warning(f"LLM error for batch {batch_start//BATCH_SIZE + 1}: {error_msg} (failure count: {self.llm_failure_count})")
-                    
-                    # Check if we should disable LLM
-                    if self.llm_failure_count >= self.llm_failure_threshold:
-                        logger.error(f"⚠️ LLM failed {self.llm_failure_count} times consecutively. Disabling LLM processing for this session.")
-                        self.llm_disabled = True
-                    
-                    # Add batch results without LLM enhancement
-                    for result in batch_results:
-                        all_processed_results.append({
-                            "title": result.get("title", ""),
-                            "url": result.get("url", ""),
-                            "snippet": result.get("snippet", ""),
-                            "full_content": result.get("full_content", ""),
-                            "source": result.get("source", "serper + firecrawl"),
-                            "source_type": "web_search",
-                            "confidence": 0.8,
-                            "key_facts": []
-                        })
-                        
+                    analyses.append(self._generate_batch_analysis(prompt, batch_num))
                 except Exception as batch_error:
-                    self.llm_failure_count += 1
-                    logger.error(f"Unexpected error processing batch {batch_start//BATCH_SIZE + 1}: {batch_error}", exc_info=True)
-                    
-                    # Check if we should disable LLM
-                    if self.llm_failure_count >= self.llm_failure_threshold:
-                        logger.error(f"⚠️ LLM failed {self.llm_failure_count} times consecutively. Disabling LLM processing for this session.")
-                        self.llm_disabled = True
-                    
-                    # Add batch results without LLM enhancement
-                    for result in batch_results:
-                        all_processed_results.append({
-                            "title": result.get("title", ""),
-                            "url": result.get("url", ""),
-                            "snippet": result.get("snippet", ""),
-                            "full_content": result.get("full_content", ""),
-                            "source": result.get("source", "serper + firecrawl"),
-                            "source_type": "web_search",
-                            "confidence": 0.8,
-                            "key_facts": []
-                        })
-            
-            # Deduplicate across all batches
-            seen_content = set()
-            processed_results = []
-            for result in all_processed_results:
-                # Use URL as deduplication key if content is empty
-                content_key = result.get("full_content", "")[:200].lower() or result.get("url", "").lower()
-                if content_key and content_key in seen_content:
-                    continue
-                seen_content.add(content_key)
-                processed_results.append(result)
-            
-            # Ensure we have results - if LLM processing failed completely, use fallback
-            if not processed_results or len(processed_results) == 0:
-                logger.warning("LLM processing returned 0 results, using fallback")
-                # Make sure fallback_results has all original results
-                if not fallback_results or len(fallback_results) == 0:
-                    # Create fallback from original results if needed
-                    for result in results:
-                        fallback_results.append({
-                            "title": result.get("title", ""),
-                            "url": result.get("url", ""),
-                            "snippet": result.get("snippet", ""),
-                            "full_content": result.get("full_content", ""),
-                            "source": result.get("source", "serper + firecrawl"),
-                            "source_type": "web_search",
-                            "confidence": 0.8,
-                            "key_facts": []
-                        })
-                return fallback_results
-            
-            # Sort by confidence (highest first)
-            processed_results.sort(key=lambda x: x.get("confidence", 0), reverse=True)
-            
-            logger.info(f"✅ LLM processed {len(processed_results)} results in {(len(results)-1)//BATCH_SIZE + 1} batches")
-            return processed_results
+                    analyses.append(batch_error)
+            
+            return self._merge_llm_batches(results, batches, analyses, top_k)
+            
+        except Exception as e:
+            return self._handle_llm_failure(results, e)
+    
+    async def _aprocess_with_llm_stream(
+        self,
+        results: List[Dict],
+        query: str
+    ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        Async variant of _process_with_llm() - batches are sent to the LLM concurrently
+        and each is yielded as soon as it completes (unranked)
+        
+        Args:
+            results: List of enriched search results
+            query: Original search query
             
+        Yields:
+            (batch_index, processed batch results) in completion order
+        """
+        if self.llm_disabled:
+            logger.debug("LLM processing disabled due to repeated failures - using basic results")
+            yield 0, self._create_basic_results(results)
+            return
+        
+        if not self.llm_engine or not results:
+            yield 0, self._create_basic_results(results)
+            return
+        
+        try:
+            logger.debug(f"🧠 Processing {len(results)} results with LLM (concurrent batches)")
+            batches = self._build_llm_batches(results, query)
         except Exception as e:
+            yield 0, self._handle_llm_failure(results, e)
+            return
+        
+        async def analyze(i: int) -> Tuple[int, Any]:
+            try:
+                return i, await asyncio.to_thread(self._generate_batch_analysis, batches[i][2], i + 1)
+            except Exception as e:
+                return i, e
+        
+        # Continuous batching - keep llm_concurrency calls in flight and start the next batch
+        # as soon as any call returns, instead of waiting for the slowest of a fixed group
+        queued = iter([i for i, (_, batch_results, _) in enumerate(batches) if self._needs_llm(batch_results)])
+        in_flight = {asyncio.ensure_future(analyze(i)) for _, i in zip(range(self.llm_concurrency), queued)}
+        try:
+            for i, batch in enumerate(batches):
+                if not self._needs_llm(batch[1]):
+                    yield i, self._merge_llm_batch(i + 1, batch, None)
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                # Refill the freed slots before handing results downstream
+                for _, i in zip(range(len(done)), queued):
+                    in_flight.add(asyncio.ensure_future(analyze(i)))
+                for task in done:
+                    i, batch_analysis = task.result()
+                    yield i, self._merge_llm_batch(i + 1, batches[i], batch_analysis)
+        finally:
+            for task in in_flight:
+                task.cancel()
+    
+    def _build_llm_batches(self, results: List[Dict], query: str) -> List[Tuple[int, List[Dict], str]]:
+        """
+        Split results into small batches and build the LLM prompt for each
+        
+        Args:
+            results: List of enriched search results
+            query: Original search query
+            
+        Returns:
+            List of (batch_start, batch_results, prompt) tuples
+        """
+        # Process in smaller batches to avoid MAX_TOKENS truncation
+        # Limit to 3 results per batch to keep prompt size very small
+        MAX_SNIPPET_LENGTH = 100  # Very short
+        
+        batches = []
+        for batch_start in range(0, len(results), self.llm_batch_size):
+            batch_results = results[batch_start:batch_start + self.llm_batch_size]
+            
+            # Build a simple context string - use only essential information to keep prompt short
+            results_text = "".join(
+                f"\nResult {i}:\nTitle: {result.get('title', '')[:100]}\nSnippet: {result.get('snippet', '')[:MAX_SNIPPET_LENGTH]}\n"
+                for i, result in enumerate(batch_results)
+            )
+            prompt = LLM_BATCH_PROMPT_TEMPLATE.format(
+                count=len(batch_results),
+                query=query,
+                results_text=results_text
+            )
+            
+            batches.append((batch_start, batch_results, prompt))
+        return batches
+    
+    def _needs_llm(self, batch_results: List[Dict]) -> bool:
+        """Check whether a batch has enough scraped content for LLM summarization to add anything"""
+        total_chars = sum(len(result.get("full_content", "")) for result in batch_results)
+        return total_chars >= self.llm_min_batch_chars
+    
+    def _generate_batch_analysis(self, prompt: str, batch_num: int) -> Dict[int, Dict]:
+        """
+        Call the LLM for one batch and parse its analysis (runs on a worker thread in async mode)
+        
+        Args:
+            prompt: Batch prompt from _build_llm_batches()
+            batch_num: 1-based batch number (for logging)
+            
+        Returns:
+            Map of result index to analysis dict
+            
+        Raises:
+            ValueError: If the LLM response is empty or cannot be parsed
+        """
+        logger.debug(f"Calling LLM for batch {batch_num} with prompt length: {len(prompt)}")
+        response = self.llm_engine.generate(
+            prompt=prompt,
+            system_prompt="You are a helpful assistant. Return ONLY valid JSON array, no markdown, no explanations.",
+            temperature=0.3,
+            max_tokens=4000,  # Increased to prevent truncation
+            timeout=30
+        )
+        
+        if not response or len(response.strip()) == 0:
+            logger.warning(f"Empty response from LLM for batch {batch_num}")
+            raise ValueError("Empty response from LLM")
+        
+        logger.debug(f"LLM response length: {len(response)}, preview: {response[:200]}")
+        
+        # Parse LLM response for this batch
+        batch_analysis = self._parse_llm_response(response)
+        
+        if not batch_analysis:
+            logger.warning(f"Failed to parse LLM response for batch {batch_num}, using original results")
+            raise ValueError("Failed to parse LLM response")
+        
+        return batch_analysis
+    
+    def _merge_llm_batches(
+        self,
+        results: List[Dict],
+        batches: List[Tuple[int, List[Dict], str]],
+        analyses: List[Any],
+        top_k: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Merge per-batch LLM analyses into results, then deduplicate and rank
+        
+        Args:
+            results: List of enriched search results
+            batches: Batches from _build_llm_batches()
+            analyses: Per-batch analysis dict, the exception raised, or None if the batch skipped the LLM
+            top_k: Only return the top_k most confident results (None = all)
+            
+        Returns:
+            Processed and ranked results (falls back to basic results if empty)
+        """
+        all_processed_results = []
+        for batch_num, (batch, batch_analysis) in enumerate(zip(batches, analyses), 1):
+            all_processed_results.extend(self._merge_llm_batch(batch_num, batch, batch_analysis))
+        
+        processed_results = self._rank_processed_results(results, all_processed_results, top_k)
+        
+        logger.info(f"✅ LLM processed {len(processed_results)} results in {len(batches)} batches")
+        return processed_results
+    
+    def _merge_llm_batch(
+        self,
+        batch_num: int,
+        batch: Tuple[int, List[Dict], str],
+        batch_analysis: Any
+    ) -> List[Dict]:
+        """
+        Merge one batch's LLM analysis into its results
+        
+        Args:
+            batch_num: 1-based batch number (for logging)
+            batch: Batch from _build_llm_batches()
+            batch_analysis: Analysis dict, the exception raised, or None if the batch skipped the LLM
+            
+        Returns:
+            Processed results for the batch (basic results if skipped or failed)
+        """
+        batch_start, batch_results, _ = batch
+        
+        if batch_analysis is None:
+            # Too little content to summarize - snippets are used as-is
+            return self._create_basic_results(batch_results)
+        
+        if isinstance(batch_analysis, BaseException):
             self.llm_failure_count += 1
-            logger.error(f"LLM processing failed completely: {e}", exc_info=True)
+            if isinstance(batch_analysis, ValueError):
+                logger.warning(f"LLM error for batch {batch_num}: {batch_analysis} (failure count: {self.llm_failure_count})")
+            else:
+                logger.error(f"Unexpected error processing batch {batch_num}: {batch_analysis}", exc_info=batch_analysis)
             
             # Check if we should disable LLM
             if self.llm_failure_count >= self.llm_failure_threshold:
                 logger.error(f"⚠️ LLM failed {self.llm_failure_count} times consecutively. Disabling LLM processing for this session.")
                 self.llm_disabled = True
             
-            # Always return fallback results - never return empty list
-            return fallback_results
+            # Add batch results without LLM enhancement
+            return self._create_basic_results(batch_results)
+        
+        # Reset failure count on success
+        self.llm_failure_count = 0
+        
+        # Merge batch analysis with results
+        processed = []
+        for i, result in enumerate(batch_results):
+            analysis = batch_analysis.get(batch_start + i, {})
+            processed.append({
+                "title": result.get("title", ""),
+                "url": result.get("url", ""),
+                "snippet": analysis.get("summary", result.get("snippet", "")),
+                "full_content": result.get("full_content", ""),
+                "source": result.get("source", "serper + firecrawl"),
+                "source_type": "web_search",
+                "confidence": analysis.get("confidence", 0.8),
+                "key_facts": analysis.get("key_facts", [])
+            })
+        return processed
+    
+    def _rank_processed_results(
+        self,
+        results: List[Dict],
+        processed_results: List[Dict],
+        top_k: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Deduplicate merged batch results across batches and sort by confidence
+        
+        Args:
+            results: Original enriched results (fallback source)
+            processed_results: Merged results of all batches, in batch order
+            top_k: Only return the top_k most confident results (None = all)
+            
+        Returns:
+            Ranked results (basic results if there are none)
+        """
+        # Deduplicate across all batches
+        processed_results = self._dedupe_by_url(processed_results)
+        
+        # Ensure we have results - if LLM processing failed completely, use fallback
+        if not processed_results:
+            logger.warning("LLM processing returned 0 results, using fallback")
+            return self._create_basic_results(results)
+        
+        # Sort by confidence (highest first) - partial heap select when only the top K are needed
+        if top_k is not None and top_k < len(processed_results):
+            return heapq.nlargest(top_k, processed_results, key=_CONFIDENCE_KEY)
+        processed_results.sort(key=_CONFIDENCE_KEY, reverse=True)
+        return processed_results
+    
+    def _handle_llm_failure(self, results: List[Dict], error: Exception) -> List[Dict]:
+        """Record a complete LLM processing failure and return basic results"""
+        self.llm_failure_count += 1
+        logger.error(f"LLM processing failed completely: {error}", exc_info=error)
+        
+        # Check if we should disable LLM
+        if self.llm_failure_count >= self.llm_failure_threshold:
+            logger.error(f"⚠️ LLM failed {self.llm_failure_count} times consecutively. Disabling LLM processing for this session.")
+            self.llm_disabled = True
+        
+        # Always return fallback results - never return empty list
+        return self._create_basic_results(results)
     
     def _create_basic_results(self, results: List[Dict]) -> List[Dict]:
         """Create basic result structure without LLM enhancement"""
-        processed = []
-        for result in results:
-            processed.append({
+        return [
+            {
                 "title": result.get("title", ""),
                 "url": result.get("url", ""),
                 "snippet": result.get("snippet", ""),
@@ -710,8 +2384,9 @@ Important: Return ONLY the JSON array, no markdown code blocks, no explanations,
                 "source_type": "web_search",
                 "confidence": 0.8,
                 "key_facts": []
-            })
-        return processed
+            }
+            for result in results
+        ]
     
     def _parse_llm_response(self, response: str) -> Dict[int, Dict]:
         """
@@ -726,133 +2401,58 @@ Important: Return ONLY the JSON array, no markdown code blocks, no explanations,
         """
         try:
             # Remove markdown code blocks if present
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0].strip()
+            fence = _JSON_FENCE_RE.search(response) or _CODE_FENCE_RE.search(response)
+            if fence:
+                response = fence.group(1).strip()
             
             # Check if response is empty
             if not response or len(response.strip()) == 0:
                 logger.warning("Empty LLM response received - cannot parse JSON")
                 return {}
             
-            # CRITICAL FIX: Extract only the first valid JSON array
-            # The LLM often returns valid JSON followed by extra text like "} ]."
-            # We need to find the first '[' and its matching ']' and extract only that
-            
             # Find the first '[' that starts a JSON array
             first_bracket = response.find('[')
             if first_bracket == -1:
                 logger.warning("No JSON array found in response")
                 return {}
             
-            # Extract from first bracket onwards
-            json_candidate = response[first_bracket:]
-            
-            # Find the matching closing ']' by tracking bracket depth
-            bracket_depth = 0
-            in_string = False
-            escape_next = False
-            json_end = -1
+            # Common case: a single clean array closed by the last ']' - parse that slice directly
+            analysis_list = None
+            last_bracket = response.rfind(']')
+            if last_bracket > first_bracket:
+                try:
+                    analysis_list = _json_loads(response[first_bracket:last_bracket + 1])
+                except json.JSONDecodeError:
+                    pass
             
-            for i, char in enumerate(json_candidate):
-                if escape_next:
-                    escape_next = False
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    continue
-                
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                
-                if not in_string:
-                    if char == '[':
-                        bracket_depth += 1
-                    elif char == ']':
-                        bracket_depth -= 1
-                        if bracket_depth == 0:
-                            json_end = i + 1
-                            break
-            
-            # If we found a complete array, extract it
-            if json_end > 0:
-                json_candidate = json_candidate[:json_end]
-            else:
-                # Fallback: try to find the last ']' before any extra text
-                # Look for patterns like "] } ]." or "] }."
-                last_bracket = json_candidate.rfind(']')
-                if last_bracket > 0:
-                    # Check if there's extra text after the last ']'
-                    after_bracket = json_candidate[last_bracket+1:].strip()
-                    if after_bracket and not after_bracket.startswith(','):
-                        # There's extra text, extract up to the last ']'
-                        json_candidate = json_candidate[:last_bracket+1]
-            
-            # Clean up the JSON candidate
-            json_candidate = json_candidate.strip()
-            
-            # Try to parse the extracted JSON
-            try:
-                analysis_list = json.loads(json_candidate)
-            except json.JSONDecodeError as json_err:
-                # If still failing, try more aggressive extraction
-                logger.debug(f"First parse attempt failed at position {json_err.pos}, trying fallback extraction")
-                
-                # Fallback: try to extract each object individually
-                # Find all { ... } objects and reconstruct array
-                objects = []
-                i = 0
-                while i < len(json_candidate):
-                    if json_candidate[i] == '{':
-                        # Find matching closing brace
-                        brace_depth = 0
-                        in_str = False
-                        escape = False
-                        obj_start = i
-                        obj_end = -1
-                        
-                        for j in range(i, len(json_candidate)):
-                            if escape:
-                                escape = False
-                                continue
-                            if json_candidate[j] == '\\':
-                                escape = True
-                                continue
-                            if json_candidate[j] == '"' and not escape:
-                                in_str = not in_str
-                                continue
-                            if not in_str:
-                                if json_candidate[j] == '{':
-                                    brace_depth += 1
-                                elif json_candidate[j] == '}':
-                                    brace_depth -= 1
-                                    if brace_depth == 0:
-                                        obj_end = j + 1
-                                        break
-                        
-                        if obj_end > 0:
-                            obj_str = json_candidate[obj_start:obj_end]
-                            try:
-                                obj = json.loads(obj_str)
-                                objects.append(obj)
-                            except:
-                                pass
-                            i = obj_end
-                        else:
-                            i += 1
+            # The LLM often returns valid JSON followed by extra text like "} ]."
+            # raw_decode() parses the first complete value in C and ignores what follows
+            if analysis_list is None:
+                try:
+                    analysis_list, _ = _JSON_DECODER.raw_decode(response, first_bracket)
+                except json.JSONDecodeError as json_err:
+                    # If still failing, salvage each well-formed { ... } object individually
+                    logger.debug(f"First parse attempt failed at position {json_err.pos}, trying fallback extraction")
+                    objects = []
+                    pos = response.find('{', first_bracket)
+                    while pos != -1:
+                        try:
+                            obj, obj_end = _JSON_DECODER.raw_decode(response, pos)
+                        except json.JSONDecodeError:
+                            # Skip the whole malformed object - its nested objects are fields, not results
+                            obj_end = _matching_brace_end(response, pos)
+                            pos = response.find('{', obj_end if obj_end != -1 else pos + 1)
+                            continue
+                        objects.append(obj)
+                        pos = response.find('{', obj_end)
+                    
+                    if objects:
+                        analysis_list = objects
+                        logger.debug(f"Extracted {len(objects)} objects using fallback method")
                     else:
-                        i += 1
-                
-                if objects:
-                    analysis_list = objects
-                    logger.debug(f"Extracted {len(objects)} objects using fallback method")
-                else:
-                    logger.error(f"JSON decode error at position {json_err.pos}: {json_err.msg}")
-                    logger.error(f"Response around error: {json_candidate[max(0, json_err.pos-50):json_err.pos+50]}")
-                    return {}
+                        logger.error(f"JSON decode error at position {json_err.pos}: {json_err.msg}")
+                        logger.error(f"Response around error: {response[max(0, json_err.pos-50):json_err.pos+50]}")
+                        return {}
             
             # Ensure it's a list
             if not isinstance(analysis_list, list):
@@ -864,19 +2464,7 @@ Important: Return ONLY the JSON array, no markdown code blocks, no explanations,
                 if not isinstance(item, dict):
                     logger.warning(f"Skipping non-dict item in LLM response: {type(item)}")
                     continue
-                index = item.get("index", len(analysis_dict))
-                # Validate and sanitize values
-                confidence = item.get("confidence", 0.8)
-                if not isinstance(confidence, (int, float)) or confidence < 0 or confidence > 1:
-                    confidence = 0.8
-                    logger.warning(f"Invalid confidence value, using default: {item.get('confidence')}")
-                
-                analysis_dict[index] = {
-                    "confidence": float(confidence),
-                    "summary": str(item.get("summary", "")).strip(),
-                    "is_duplicate": bool(item.get("is_duplicate", False)),
-                    "key_facts": item.get("key_facts", []) if isinstance(item.get("key_facts"), list) else []
-                }
+                analysis_dict[item.get("index", len(analysis_dict))] = _make_analysis(item)
             
             logger.debug(f"✅ Successfully parsed {len(analysis_dict)} analysis items from LLM response")
             return analysis_dict
@@ -904,75 +2492,98 @@ Important: Return ONLY the JSON array, no markdown code blocks, no explanations,
             return
         
         try:
-            all_chunks = []
-            all_metadatas = []
-            
-            for result in results:
-                # Get full content
-                full_content = result.get('full_content', '')
-                title = result.get('title', '')
-                url = result.get('url', '')
-                
-                if not full_content:
-                    continue
-                
-                # Combine title and content
-                combined_text = f"{title}\n\n{full_content}" if title else full_content
-                
-                # Chunk the content
-                chunks = self.chunker.chunk(
-                    text=combined_text,
-                    metadata={
-                        "source": "web_search",
-                        "url": url,
-                        "query": query,
-                        "title": title,
-                        "confidence": result.get("confidence", 0.8),
-                        "key_facts": result.get("key_facts", [])
-                    },
-                    url=url,
-                    query=query
-                )
-                
-                # Score each chunk
-                scored_chunks = []
-                for chunk in chunks:
-                    score_result = self.scorer.score(
-                        text=chunk['text'],
-                        metadata=chunk['metadata'],
-                        query=query
-                    )
-                    
-                    # Only keep high-quality chunks
-                    if score_result['total_score'] >= 0.3:
-                        chunk['metadata']['score'] = score_result
-                        scored_chunks.append(chunk)
-                
-                # Filter by score
-                scored_chunks = self.scorer.filter_by_score(
-                    [{"text": c['text'], "metadata": c['metadata'], "score": c['metadata']['score']} 
-                     for c in scored_chunks],
-                    min_score=0.3
-                )
-                
-                # Add to batch
-                for chunk_data in scored_chunks:
-                    all_chunks.append(chunk_data['text'])
-                    # Sanitize metadata for ChromaDB (convert lists/dicts to JSON strings)
-                    sanitized_metadata = self._sanitize_metadata(chunk_data['metadata'])
-                    all_metadatas.append(sanitized_metadata)
-            
-            # Store all chunks in batch
+            all_chunks, all_metadatas = self._chunk_results_for_rag(results, query)
+            
+            # Store all chunks in size-bounded sub-batches
             if all_chunks:
-                self.vector_store.add_documents(
-                    texts=all_chunks,
-                    metadatas=all_metadatas
-                )
-                logger.info(f"✅ Stored {len(all_chunks)} processed chunks in vector database")
+                size = self.rag_write_batch_size
+                batches = [
+                    (all_chunks[i:i + size], all_metadatas[i:i + size])
+                    for i in range(0, len(all_chunks), size)
+                ]
+                if len(batches) == 1:
+                    self.vector_store.add_documents(texts=all_chunks, metadatas=all_metadatas)
+                else:
+                    # Scoped pool - one batch embeds while another is written
+                    with ThreadPoolExecutor(max_workers=min(self.rag_write_workers, len(batches))) as executor:
+                        futures = [
+                            executor.submit(self.vector_store.add_documents, texts=texts, metadatas=metadatas)
+                            for texts, metadatas in batches
+                        ]
+                        for future in futures:
+                            future.result()
+                logger.info(f"✅ Stored {len(all_chunks)} processed chunks in vector database ({len(batches)} batches)")
             
         except Exception as e:
             logger.warning(f"Failed to store results in RAG: {e}", exc_info=True)
     
+    def _chunk_results_for_rag(
+        self,
+        results: List[Dict],
+        query: str,
+        seen_texts: Optional[set] = None
+    ) -> Tuple[List[str], List[Dict]]:
+        """
+        Chunk and score search results for the vector store
+        
+        Args:
+            results: List of processed search results
+            query: Original search query
+            seen_texts: Chunk texts already stored this session (updated in place)
+            
+        Returns:
+            (texts, ChromaDB-safe metadatas) of the high-quality chunks, in result order,
+            without chunks whose exact text was already seen
+        """
+        if seen_texts is None:
+            seen_texts = set()
+        all_chunks = []
+        all_metadatas = []
+        jobs = []
+        
+        for result in results:
+            # Get full content
+            full_content = result.get('full_content', '')
+            title = result.get('title', '')
+            url = result.get('url', '')
+            
+            if not full_content:
+                continue
+            
+            # Combine title and content
+            combined_text = f"{title}\n\n{full_content}" if title else full_content
+            metadata = {
+                "source": "web_search",
+                "url": url,
+                "query": query,
+                "title": title,
+                "confidence": result.get("confidence", 0.8),
+                "key_facts": result.get("key_facts", [])
+            }
+            jobs.append((combined_text, metadata, url, query, self.chunker, self.scorer))
+        
+        # Chunk and score results in parallel when a CPU pool is configured (pure Python, GIL-bound)
+        result_chunks = None
+        cpu_pool = self._get_cpu_pool() if len(jobs) > 1 else None
+        if cpu_pool is not None:
+            try:
+                result_chunks = list(cpu_pool.map(_chunk_and_score, *zip(*jobs)))
+            except Exception as e:
+                logger.warning(f"Chunking workers failed, chunking inline: {e}")
+        if result_chunks is None:
+            result_chunks = [_chunk_and_score(*job) for job in jobs]
+        
+        # Add to batch - syndicated pages repeat chunks verbatim, and each copy would cost an embedding
+        for texts, metadatas in result_chunks:
+            for text, metadata in zip(texts, metadatas):
+                if text in seen_texts:
+                    continue
+                seen_texts.add(text)
+                all_chunks.append(text)
+                all_metadatas.append(metadata)
+        
+        return all_chunks, all_metadatas
+    
     # ==================== Fallback & Utilities ====================
     
     def _fallback_search(self, query: str, max_results: int) -> List[Dict]:
@@ -993,35 +2604,8 @@ Important: Return ONLY the JSON array, no markdown code blocks, no explanations,
         return []
     
     def _sanitize_metadata(self, metadata: Dict) -> Dict:
-        """
-        Sanitize metadata for ChromaDB compatibility
-        ChromaDB only accepts: str, int, float, bool, None
-        Converts lists and dicts to JSON strings
-        
-        Args:
-            metadata: Metadata dictionary
-            
-        Returns:
-            Sanitized metadata dictionary
-        """
-        sanitized = {}
-        
-        for key, value in metadata.items():
-            if value is None:
-                sanitized[key] = None
-            elif isinstance(value, (str, int, float, bool)):
-                sanitized[key] = value
-            elif isinstance(value, list):
-                # Convert list to JSON string
-                sanitized[key] = json.dumps(value) if value else ""
-            elif isinstance(value, dict):
-                # Convert dict to JSON string
-                sanitized[key] = json.dumps(value) if value else "{}"
-            else:
-                # Convert other types to string
-                sanitized[key] = str(value)
-        
-        return sanitized
+        """Sanitize metadata for ChromaDB compatibility (see _sanitize_metadata())"""
+        return _sanitize_metadata(metadata)
     
     def _clean_text(self, text: str) -> str:
         """
@@ -1036,29 +2620,5 @@ Important: Return ONLY the JSON array, no markdown code blocks, no explanations,
         if not text:
             return ""
         
-        import re
-        from urllib.parse import unquote
-        
-        # Remove URL-encoded fragments
-        text = re.sub(r'%[0-9A-Fa-f]{2}', '', text)
-        
-        # Remove URLs
-        text = re.sub(r'https?://[^\s]+', '', text)
-        text = re.sub(r'www\.[^\s]+', '', text)
-        text = re.sub(r'[a-zA-Z0-9]+\.(io|com|org|net|edu|gov)[^\s]*', '', text)
-        
-        # Remove tracking parameters
-        text = re.sub(r'\b(rut|utm_|ref|source|campaign|medium|term|content)=[a-zA-Z0-9]+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'&[a-zA-Z0-9_]+=[a-zA-Z0-9]+', '', text)
-        
-        # Remove hex tracking IDs
-        text = re.sub(r'\b[0-9a-f]{32,}\b', '', text, flags=re.IGNORECASE)
-        
-        # Decode URL-encoded characters
-        text = unquote(text, errors='ignore')
-        
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        # Pure function of the text - syndicated titles/snippets and cached scrapes repeat verbatim
+        return _clean_artifacts(text)
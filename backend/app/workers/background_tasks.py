@@ -88,6 +88,49 @@ class BackgroundWorker:
             # Run synchronously
             return self._crawl_and_index_sync(company_name, query, vector_store, web_search_tool)
     
+    async def crawl_and_index_async(
+        self,
+        company_name: str,
+        query: Optional[str] = None,
+        vector_store=None,
+        web_search_tool=None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of crawl_and_index() that never blocks the event loop
+        
+        In sync mode the crawl uses WebSearchTool.asearch() when available,
+        otherwise the blocking search() runs in a worker thread.
+        
+        Args:
+            company_name: Company name to crawl
+            query: Optional search query
+            vector_store: VectorStore instance
+            web_search_tool: WebSearchTool instance
+            
+        Returns:
+            Task result dictionary
+        """
+        if self.celery_app or not web_search_tool:
+            # Celery dispatch talks to the broker - keep it off the event loop too
+            return await asyncio.to_thread(self.crawl_and_index, company_name, query, vector_store, web_search_tool)
+        
+        try:
+            logger.info(f"🕷️ Starting crawl and index for: {company_name}")
+            
+            search_query = query or f"{company_name} company overview business"
+            if hasattr(web_search_tool, "asearch"):
+                results = await web_search_tool.asearch(search_query, max_results=10, company_name=company_name)
+            else:
+                results = await asyncio.to_thread(
+                    web_search_tool.search, search_query, max_results=10, company_name=company_name
+                )
+            
+            return self._crawl_result(company_name, results)
+            
+        except Exception as e:
+            logger.error(f"Crawl and index error: {e}", exc_info=True)
+            return {"error": str(e), "status": "failed"}
+    
     def _crawl_and_index_sync(
         self,
         company_name: str,
@@ -115,20 +158,23 @@ class BackgroundWorker:
             
             # Perform search
             search_query = query or f"{company_name} company overview business"
-            results = web_search_tool.search(search_query, max_results=10)
+            results = web_search_tool.search(search_query, max_results=10, company_name=company_name)
             
-            # Results are automatically stored in RAG by WebSearchTool
-            return {
-                "status": "completed",
-                "company_name": company_name,
-                "results_count": len(results),
-                "timestamp": datetime.now().isoformat()
-            }
+            return self._crawl_result(company_name, results)
             
         except Exception as e:
             logger.error(f"Crawl and index error: {e}", exc_info=True)
             return {"error": str(e), "status": "failed"}
     
+    def _crawl_result(self, company_name: str, results: list) -> Dict[str, Any]:
+        """Build the crawl task result (results are stored in RAG by WebSearchTool)"""
+        return {
+            "status": "completed",
+            "company_name": company_name,
+            "results_count": len(results),
+            "timestamp": datetime.now().isoformat()
+        }
+    
     def periodic_reindex(
         self,
         company_name: Optional[str] = None,
@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for production
+Run with: gunicorn main:app -c gunicorn.conf.py
+"""
+
+import os
+
+# Uvicorn workers (uvloop + httptools are picked up automatically when installed)
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# One worker per core when WEB_CONCURRENCY=auto. The default stays at 1 because
+# SessionMemory lives in process memory and the Chroma vector DB is opened per process -
+# only scale out once sessions are served from MongoDB and the vector store is shared.
+# Rate limits hold across workers only with Redis reachable at REDIS_URL.
+_concurrency = os.getenv("WEB_CONCURRENCY", "1")
+workers = (os.cpu_count() or 1) if _concurrency == "auto" else int(_concurrency)
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# Import the app once in the master; MongoDB, Redis, HTTP and vector store clients are
+# created per worker in lifespan, so no connection is shared across the fork
+preload_app = True
+
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
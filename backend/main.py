@@ -4,16 +4,16 @@ Main entry point for the backend server
 """
 
 import os
+import asyncio
+import importlib
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-else:
-    # Will be logged after logging setup
-    pass
+# Load environment variables from .env file (status is logged after logging setup)
+ENV_PATH = Path(__file__).parent / ".env"
+ENV_LOADED = ENV_PATH.exists()
+if ENV_LOADED:
+    load_dotenv(ENV_PATH)
 
 # Disable ChromaDB telemetry to prevent PostHog errors
 os.environ.setdefault("ANONYMIZED_TELEMETRY", "False")
@@ -26,52 +26,53 @@ import logging
 logger = logging.getLogger(__name__)
 
 # Log .env loading status
-env_path = Path(__file__).parent / ".env"
-if env_path.exists():
-    logger.info(f"Loaded .env file from {env_path}")
+if ENV_LOADED:
+    logger.info(f"Loaded .env file from {ENV_PATH}")
 else:
-    logger.warning(f".env file not found at {env_path}")
+    logger.warning(f".env file not found at {ENV_PATH}")
 
+import httpx
+import orjson
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.requests import ClientDisconnect
+from starlette.responses import Response
+from anyio import EndOfStream
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 
-from app.api import chat, voice, files, account_plan, health, pdf_export, auth, chats, websocket, uploads, plans
-from app.api import voice_backend
 from app.rag.vector_store import VectorStore
 from app.agent.memory import SessionMemory
-from app.config import VECTOR_DB_PATH
+from app.config import VECTOR_DB_PATH, REDIS_URL, DEBUG
 from app.database import connect_to_mongo, close_mongo_connection
-from app.middleware.rate_limit import rate_limit_middleware
+from app.middleware.rate_limit import RateLimitMiddleware, init_rate_limiter, close_rate_limiter
 
 # Global state
 vector_store = None
-session_memory = SessionMemory()
+session_memory = None
+http_client = None
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Initialize and cleanup resources"""
-    global vector_store
-    
-    # Connect to MongoDB
-    mongo_connected = await connect_to_mongo()
-    if not mongo_connected:
-        logger.warning("MongoDB connection failed - some features may be limited")
-    
-    # Initialize vector store (non-blocking - don't wait for model download)
+# Seconds each shutdown step may take before it is abandoned
+SHUTDOWN_TIMEOUT = 10
+
+# Exceptions meaning the client went away mid-request (nothing can be sent back)
+DISCONNECT_EXCEPTIONS = (EndOfStream, ClientDisconnect, ConnectionResetError, BrokenPipeError)
+
+def init_vector_store():
+    """Create the vector store (blocking - loads the embedding model); None if it fails"""
     try:
         os.makedirs(VECTOR_DB_PATH, exist_ok=True)
         logger.info(f"Initializing vector store at {VECTOR_DB_PATH}...")
         logger.info("Note: Embedding model download may take time on first run. Server will start anyway.")
         
-        # Initialize in background to avoid blocking server startup
-        vector_store = VectorStore(VECTOR_DB_PATH)
+        store = VectorStore(VECTOR_DB_PATH)
         # Log the actual path being used (may differ if auto-reset created new path)
-        actual_path = vector_store.db_path if vector_store else VECTOR_DB_PATH
+        actual_path = store.db_path if store else VECTOR_DB_PATH
         logger.info(f"✅ Vector store initialized at {actual_path}")
+        return store
     except ValueError as e:
         # Schema error - provide helpful instructions
         error_msg = str(e)
@@ -83,12 +84,50 @@ async def lifespan(app: FastAPI):
         else:
             logger.error(f"Vector store initialization error: {e}")
         logger.warning("Server will continue but RAG features may be limited")
-        vector_store = None
+        return None
     except Exception as e:
         logger.error(f"Vector store initialization error: {e}")
         logger.warning("Server will continue but RAG features may be limited")
+        return None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize and cleanup resources"""
+    global vector_store, session_memory, http_client
+    
+    # Per-worker session store, bounded so idle sessions can't grow memory without limit
+    session_memory = SessionMemory(max_entries=int(os.getenv("SESSION_MEMORY_MAX_ENTRIES", "10000")))
+    
+    # One pooled HTTP client for outbound API calls - keep-alive connections across requests
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    app.state.http_client = http_client
+    
+    # Independent startup steps run concurrently: MongoDB, the shared (Redis) rate limit
+    # counters, and the vector store (in a thread - model loading would block the loop)
+    mongo_connected, redis_limiting, vector_store = await asyncio.gather(
+        connect_to_mongo(),
+        init_rate_limiter(REDIS_URL),
+        asyncio.to_thread(init_vector_store),
+        return_exceptions=True
+    )
+    if mongo_connected is not True:
+        if isinstance(mongo_connected, BaseException):
+            logger.error(f"❌ MongoDB connection error: {mongo_connected}")
+        logger.warning("MongoDB connection failed - some features may be limited")
+    if isinstance(redis_limiting, BaseException):
+        logger.warning(f"Rate limiter setup failed ({redis_limiting}) - using in-memory rate limiting (per worker)")
+    if isinstance(vector_store, BaseException):
+        logger.error(f"Vector store initialization error: {vector_store}")
+        logger.warning("Server will continue but RAG features may be limited")
         vector_store = None
     
+    # Shared with routes via request.app.state (no per-request middleware)
+    app.state.vector_store = vector_store
+    app.state.session_memory = session_memory
+    
     # Check LLM availability (quick check - just verify API keys, don't initialize)
     try:
         gemini_key = os.getenv("GEMINI_API_KEY")
@@ -104,22 +143,42 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # Cleanup
+    # Cleanup - each step is bounded so a hung backend can't stall shutdown past the grace period
     if vector_store:
         try:
-            vector_store.close()
+            await asyncio.wait_for(asyncio.to_thread(vector_store.close), timeout=SHUTDOWN_TIMEOUT)
             logger.info("Vector store closed")
-        except:
-            pass
+        except asyncio.TimeoutError:
+            logger.error(f"Vector store close timed out after {SHUTDOWN_TIMEOUT}s - forcing shutdown")
+        except Exception as e:
+            logger.warning(f"Vector store close failed: {e}")
+    
+    await close_rate_limiter()
+    await http_client.aclose()
+    
+    # Process-wide web search resources (HTTP session, caches, worker pool)
+    from app.tools.web_search import close_shared_resources
+    try:
+        await asyncio.wait_for(asyncio.to_thread(close_shared_resources), timeout=SHUTDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error(f"Web search resource cleanup timed out after {SHUTDOWN_TIMEOUT}s - forcing shutdown")
+    except Exception as e:
+        logger.warning(f"Web search resource cleanup failed: {e}")
     
     # Close MongoDB connection
-    await close_mongo_connection()
+    try:
+        await asyncio.wait_for(close_mongo_connection(), timeout=SHUTDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error(f"MongoDB close timed out after {SHUTDOWN_TIMEOUT}s - forcing shutdown")
+    except Exception as e:
+        logger.warning(f"MongoDB close failed: {e}")
 
 app = FastAPI(
     title="Company Research Assistant API",
     description="Enterprise-grade Agentic AI system for company research and account planning",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson (C) encoding for every route
 )
 
 # Global exception handler for unhandled errors
@@ -127,26 +186,13 @@ app = FastAPI(
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions with proper logging"""
     # Handle client disconnection gracefully
-    from anyio import EndOfStream
-    from starlette.responses import Response
-    if isinstance(exc, EndOfStream):
+    if isinstance(exc, DISCONNECT_EXCEPTIONS):
         # Client disconnected, don't try to send response
-        logger.debug("Client disconnected (EndOfStream)")
+        logger.debug(f"Client disconnected ({type(exc).__name__})")
         # Return an empty response that won't try to send data
         # This prevents trying to send to a disconnected client
         return Response(status_code=204)  # No Content - won't send body
     
-    # Don't log client disconnection errors as errors
-    if "client disconnected" in str(exc).lower() or "connection closed" in str(exc).lower() or "endofstream" in str(exc).lower():
-        logger.debug(f"Client disconnected: {exc}")
-        try:
-            return JSONResponse(
-                status_code=status.HTTP_200_OK,
-                content={"detail": "Client disconnected"}
-            )
-        except Exception:
-            return None
-    
     logger.error(
         f"Unhandled exception: {exc}",
         exc_info=True,
@@ -158,12 +204,12 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
     
     try:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
                 "message": "An unexpected error occurred. Please try again or contact support.",
-                "detail": str(exc) if os.getenv("DEBUG", "false").lower() == "true" else None
+                "detail": str(exc) if DEBUG else None
             }
         )
     except Exception:
@@ -174,52 +220,60 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors"""
-    logger.warning(f"Validation error: {exc.errors()}")
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "Validation error",
-            "message": "Invalid request data. Please check your input.",
-            "details": exc.errors()
-        }
-    )
+    errors = exc.errors()
+    logger.warning(f"Validation error: {errors}")
+    # Encoded straight by orjson; default=str covers non-JSON ctx values (e.g. ValueError)
+    body = orjson.dumps({
+        "error": "Validation error",
+        "message": "Invalid request data. Please check your input.",
+        "details": errors
+    }, default=str)
+    return Response(body, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, media_type="application/json")
+
+# Rate limit every HTTP request and WebSocket handshake per client and endpoint (innermost,
+# so CORS headers still reach 429 responses)
+app.add_middleware(RateLimitMiddleware)
+
+# Compress responses over 1 KB (large plan/chat JSON) for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-# CORS middleware - allow all origins in development
+# CORS middleware - allow all origins in development (added last, so outermost)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
+    max_age=86400,  # Browsers cache preflight responses for a day
 )
 
-# Rate limiting middleware
-@app.middleware("http")
-async def rate_limit(request: Request, call_next):
-    try:
-        return await rate_limit_middleware(request, call_next)
-    except Exception as e:
-        # Handle client disconnection in middleware
-        from anyio import EndOfStream
-        from starlette.responses import Response
-        if isinstance(e, EndOfStream):
-            logger.debug("Client disconnected during rate limit check")
-            # Return empty response - won't try to send to disconnected client
-            return Response(status_code=204)  # No Content
-        raise
-
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-app.include_router(chat.router, prefix="/api/chat", tags=["chat"])  # Legacy chat endpoint
-app.include_router(chats.router, prefix="/api/chats", tags=["chats"])  # New production chat endpoints
-app.include_router(voice.router, prefix="/api/voice", tags=["voice"])
-app.include_router(voice_backend.router, prefix="/api/voice", tags=["voice"])
-app.include_router(files.router, prefix="/api/files", tags=["files"])
-app.include_router(account_plan.router, prefix="/api/account-plan", tags=["account-plan"])
-app.include_router(pdf_export.router, prefix="/api/account-plan", tags=["account-plan"])
-app.include_router(health.router, prefix="/api", tags=["health"])
-app.include_router(uploads.router, prefix="/api/uploads", tags=["uploads"])
-app.include_router(plans.router, prefix="/api/plans", tags=["plans"])
+# Include routers. Only the optional features (voice, pdf_export, uploads) can be switched off
+# with ENABLE_<NAME>=false; core routers (auth, chat, health, ...) are always mounted so a
+# stray env var can't remove them
+
+def feature_enabled(name: str) -> bool:
+    """ENABLE_<NAME>=false turns an optional feature off - its modules (and the SDKs they pull in) are never imported"""
+    return os.getenv(f"ENABLE_{name.upper()}", "true").lower() == "true"
+
+def include_api_router(name: str, prefix: str, tag: str, feature: str = None):
+    """Import app.api.<name> and mount its router, unless its optional feature is disabled"""
+    if feature is not None and not feature_enabled(feature):
+        logger.warning(f"Router app.api.{name} not mounted (ENABLE_{feature.upper()}=false)")
+        return
+    module = importlib.import_module(f"app.api.{name}")
+    app.include_router(module.router, prefix=prefix, tags=[tag])
+
+include_api_router("auth", "/api/auth", "auth")
+include_api_router("chat", "/api/chat", "chat")  # Legacy chat endpoint
+include_api_router("chats", "/api/chats", "chats")  # New production chat endpoints
+include_api_router("voice", "/api/voice", "voice", feature="voice")
+include_api_router("voice_backend", "/api/voice", "voice", feature="voice")
+include_api_router("files", "/api/files", "files")
+include_api_router("account_plan", "/api/account-plan", "account-plan")
+include_api_router("pdf_export", "/api/account-plan", "account-plan", feature="pdf_export")
+include_api_router("health", "/api", "health")
+include_api_router("uploads", "/api/uploads", "uploads", feature="uploads")
+include_api_router("plans", "/api/plans", "plans")
 
 # Metrics endpoint
 try:
@@ -229,50 +283,47 @@ except ImportError:
     logger.warning("Prometheus client not available. Metrics endpoint disabled.")
 
 # Static file serving for avatars
-import os
-from pathlib import Path
 uploads_dir = Path("uploads")
-uploads_dir.mkdir(exist_ok=True)
-avatars_dir = uploads_dir / "avatars"
-avatars_dir.mkdir(exist_ok=True)
+(uploads_dir / "avatars").mkdir(parents=True, exist_ok=True)
 
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+# Behind a reverse proxy set SERVE_UPLOADS=false and let it serve the files with sendfile,
+# keeping the bytes out of Python entirely, e.g. for nginx:
+#   location /uploads/ { root /app; sendfile on; tcp_nopush on; expires 7d; }
+if os.getenv("SERVE_UPLOADS", "true").lower() == "true":
+    app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
 
 # WebSocket routes (no prefix, handled differently)
-from fastapi import WebSocket
+from app.api import websocket
 app.websocket("/ws/chats/{chat_id}/stream")(websocket.chat_stream)
 
+# Constant bodies for the probe endpoints, encoded once. A fresh Response wraps them per call -
+# sharing one Response object is unsafe, since middlewares (CORS) append to its header list
+ROOT_BODY = ORJSONResponse({
+    "message": "Company Research Assistant API",
+    "version": "1.0.0",
+    "status": "running"
+}).body
+HEALTH_BODY = ORJSONResponse({"status": "healthy"}).body
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Company Research Assistant API",
-        "version": "1.0.0",
-        "status": "running"
-    }
+    return Response(ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy"}
-
-# Make vector_store available to routes
-@app.middleware("http")
-async def add_vector_store(request, call_next):
-    try:
-        request.state.vector_store = vector_store
-        request.state.session_memory = session_memory
-        response = await call_next(request)
-        return response
-    except Exception as e:
-        # Handle client disconnection gracefully
-        from anyio import EndOfStream
-        from starlette.responses import Response
-        if isinstance(e, EndOfStream):
-            logger.debug("Client disconnected during request processing")
-            # Return empty response - won't try to send to disconnected client
-            return Response(status_code=204)  # No Content
-        raise
+    return Response(HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop event loop + httptools parser (uvloop is unavailable on Windows)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        proxy_headers=True
+    )
 
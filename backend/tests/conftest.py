@@ -0,0 +1,23 @@
+import pytest_asyncio
+from asgi_lifespan import LifespanManager
+from httpx import AsyncClient, ASGITransport
+
+
+async def _mongo_unavailable():
+    return False
+
+
+async def _no_redis_limiter(redis_url):
+    return False
+
+
+@pytest_asyncio.fixture
+async def client(monkeypatch):
+    """Async client bound to the app in-process - lifespan runs with MongoDB, Redis and the vector store stubbed out"""
+    import main
+    monkeypatch.setattr(main, "connect_to_mongo", _mongo_unavailable)
+    monkeypatch.setattr(main, "init_rate_limiter", _no_redis_limiter)
+    monkeypatch.setattr(main, "init_vector_store", lambda: None)
+    async with LifespanManager(main.app):
+        async with AsyncClient(transport=ASGITransport(app=main.app), base_url="http://test") as c:
+            yield c
@@ -3,19 +3,10 @@ Unit tests for authentication endpoints
 """
 
 import pytest
-from fastapi.testclient import TestClient
 from app.database import get_database
 from bson import ObjectId
 
-# This would be imported from your main app
-# from main import app
-
-@pytest.fixture
-def client():
-    # Create test client
-    # client = TestClient(app)
-    # return client
-    pass
+# client fixture (httpx.AsyncClient over ASGITransport) lives in conftest.py
 
 @pytest.fixture
 def test_user():
@@ -28,7 +19,7 @@ def test_user():
 @pytest.mark.asyncio
 async def test_register_user(client, test_user):
     """Test user registration"""
-    # response = client.post("/api/auth/register", json=test_user)
+    # response = await client.post("/api/auth/register", json=test_user)
     # assert response.status_code == 201
     # assert response.json()["email"] == test_user["email"]
     pass
@@ -37,10 +28,10 @@ async def test_register_user(client, test_user):
 async def test_login_user(client, test_user):
     """Test user login"""
     # First register
-    # client.post("/api/auth/register", json=test_user)
+    # await client.post("/api/auth/register", json=test_user)
     
     # Then login
-    # response = client.post("/api/auth/login", json={
+    # response = await client.post("/api/auth/login", json={
     #     "email": test_user["email"],
     #     "password": test_user["password"]
     # })
@@ -52,15 +43,15 @@ async def test_login_user(client, test_user):
 async def test_get_profile(client, test_user):
     """Test getting user profile"""
     # Register and login
-    # client.post("/api/auth/register", json=test_user)
-    # login_response = client.post("/api/auth/login", json={
+    # await client.post("/api/auth/register", json=test_user)
+    # login_response = await client.post("/api/auth/login", json={
     #     "email": test_user["email"],
     #     "password": test_user["password"]
     # })
     # token = login_response.json()["access_token"]
     
     # Get profile
-    # response = client.get(
+    # response = await client.get(
     #     "/api/auth/profile",
     #     headers={"Authorization": f"Bearer {token}"}
     # )
@@ -72,7 +63,7 @@ async def test_get_profile(client, test_user):
 async def test_update_profile(client, test_user):
     """Test updating user profile"""
     # Similar setup as above
-    # response = client.put(
+    # response = await client.put(
     #     "/api/auth/profile",
     #     headers={"Authorization": f"Bearer {token}"},
     #     json={"name": "Updated Name"}
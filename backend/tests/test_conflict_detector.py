@@ -0,0 +1,29 @@
+"""
+Unit tests for conflict detection
+"""
+
+from app.tools.conflict_detector import ConflictDetector
+
+
+def _doc(source_file: str, text: str) -> dict:
+    return {'text': text, 'source_type': 'uploaded_document', 'metadata': {'source_file': source_file}}
+
+
+def test_conflict_message_attributes_formatting_variants():
+    """Sources whose values differ only in formatting are listed under the same value"""
+    detector = ConflictDetector()
+    conflicts = detector.detect_conflicts([
+        _doc('annual_report.pdf', 'Annual revenue of $1,000 million.'),
+        _doc('press_release.pdf', 'Annual revenue of $1000 million.'),
+        _doc('analyst_note.pdf', 'Annual revenue of $5,000 million.'),
+    ])
+    
+    assert len(conflicts) == 1
+    conflict = conflicts[0]
+    assert conflict['topic'] == 'revenue'
+    assert len(conflict['conflicting_values']) == 2
+    
+    message = detector.format_conflict_message(conflict)
+    assert 'Annual Report' in message
+    assert 'Press Release' in message
+    assert 'Analyst Note' in message
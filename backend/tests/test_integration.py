@@ -8,37 +8,37 @@ import pytest
 async def test_full_workflow():
     """Test complete workflow: register -> upload -> research -> generate -> edit -> download"""
     # 1. Register user
-    # register_response = client.post("/api/auth/register", json={...})
+    # register_response = await client.post("/api/auth/register", json={...})
     # assert register_response.status_code == 201
     
     # 2. Login
-    # login_response = client.post("/api/auth/login", json={...})
+    # login_response = await client.post("/api/auth/login", json={...})
     # token = login_response.json()["access_token"]
     
     # 3. Create chat
-    # chat_response = client.post("/api/chats", headers={"Authorization": f"Bearer {token}"}, json={...})
+    # chat_response = await client.post("/api/chats", headers={"Authorization": f"Bearer {token}"}, json={...})
     # chat_id = chat_response.json()["id"]
     
     # 4. Upload file
-    # init_response = client.post("/api/uploads/init", headers={"Authorization": f"Bearer {token}"})
+    # init_response = await client.post("/api/uploads/init", headers={"Authorization": f"Bearer {token}"})
     # upload_id = init_response.json()["uploadId"]
     # # Upload chunks...
-    # complete_response = client.post(f"/api/uploads/{upload_id}/complete", ...)
+    # complete_response = await client.post(f"/api/uploads/{upload_id}/complete", ...)
     
     # 5. Send research message
-    # message_response = client.post(f"/api/chats/{chat_id}/messages", ...)
+    # message_response = await client.post(f"/api/chats/{chat_id}/messages", ...)
     
     # 6. Wait for plan generation (or check status)
     # plan_id = ...
     
     # 7. Edit a section
-    # edit_response = client.put(f"/api/plans/{plan_id}/section/company_overview", ...)
+    # edit_response = await client.put(f"/api/plans/{plan_id}/section/company_overview", ...)
     
     # 8. Regenerate a section
-    # regenerate_response = client.post(f"/api/plans/{plan_id}/section/opportunities/regenerate", ...)
+    # regenerate_response = await client.post(f"/api/plans/{plan_id}/section/opportunities/regenerate", ...)
     
     # 9. Download PDF
-    # pdf_response = client.get(f"/api/plans/{plan_id}/download", ...)
+    # pdf_response = await client.get(f"/api/plans/{plan_id}/download", ...)
     # assert pdf_response.status_code == 200
     
     pass
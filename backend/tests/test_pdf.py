@@ -11,7 +11,7 @@ async def test_download_pdf():
     # plan_id = ...
     
     # Download PDF
-    # response = client.get(
+    # response = await client.get(
     #     f"/api/plans/{plan_id}/download",
     #     headers={"Authorization": f"Bearer {token}"}
     # )
@@ -8,11 +8,11 @@ import pytest
 async def test_regenerate_section():
     """Test plan section regeneration"""
     # Create a plan first
-    # plan_response = client.post("/api/plans", ...)
+    # plan_response = await client.post("/api/plans", ...)
     # plan_id = plan_response.json()["id"]
     
     # Regenerate a section
-    # response = client.post(
+    # response = await client.post(
     #     f"/api/plans/{plan_id}/section/company_overview/regenerate",
     #     headers={"Authorization": f"Bearer {token}"}
     # )
@@ -26,7 +26,7 @@ async def test_regenerate_section():
 @pytest.mark.asyncio
 async def test_regenerate_strict_json():
     """Test that regeneration returns strict JSON"""
-    # response = client.post(...)
+    # response = await client.post(...)
     # content = response.json()["content"]
     # # Verify content is valid and not markdown-wrapped
     # assert not content.startswith("```")
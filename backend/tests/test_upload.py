@@ -8,7 +8,7 @@ from io import BytesIO
 @pytest.mark.asyncio
 async def test_init_upload():
     """Test upload initialization"""
-    # response = client.post(
+    # response = await client.post(
     #     "/api/uploads/init",
     #     headers={"Authorization": f"Bearer {token}"}
     # )
@@ -20,14 +20,14 @@ async def test_init_upload():
 @pytest.mark.asyncio
 async def test_upload_chunk():
     """Test chunk upload"""
-    # init_response = client.post("/api/uploads/init", headers={"Authorization": f"Bearer {token}"})
+    # init_response = await client.post("/api/uploads/init", headers={"Authorization": f"Bearer {token}"})
     # upload_id = init_response.json()["uploadId"]
     
     # chunk_data = BytesIO(b"test chunk data")
     # files = {"file": ("chunk.bin", chunk_data, "application/octet-stream")}
     # data = {"chunk_index": 0, "total_chunks": 1}
     
-    # response = client.post(
+    # response = await client.post(
     #     f"/api/uploads/{upload_id}/chunk",
     #     headers={"Authorization": f"Bearer {token}"},
     #     files=files,
@@ -40,7 +40,7 @@ async def test_upload_chunk():
 async def test_complete_upload():
     """Test upload completion"""
     # Similar setup - init, upload chunks, then complete
-    # response = client.post(
+    # response = await client.post(
     #     f"/api/uploads/{upload_id}/complete",
     #     headers={"Authorization": f"Bearer {token}"}
     # )